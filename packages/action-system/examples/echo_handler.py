@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
 from action_system import ActionHandler, ActionRequest, PermissionDef
 
 
+@dataclass(slots=True)
+class EchoParams:
+    message: str = ""
+    channel: str = "default"
+
+
 class EchoHandler(ActionHandler):
     """Echoes back whatever you send it. Perfect for testing the full flow."""
 
@@ -19,6 +26,7 @@ class EchoHandler(ActionHandler):
             parameters={"channel": "Where to echo (optional)"},
         ),
     ]
+    params_schema = EchoParams
 
     def get_required_permission(
         self, action_name: str, params: dict[str, Any]
@@ -28,13 +36,11 @@ class EchoHandler(ActionHandler):
             scope["channel"] = channel
         return "echo", scope
 
-    def execute(self, action_name: str, params: dict[str, Any]) -> Any:
-        message = params.get("message", "")
-        channel = params.get("channel", "default")
+    def execute(self, action_name: str, params: EchoParams) -> Any:
         return {
             "echoed": True,
-            "message": message,
-            "channel": channel,
+            "message": params.message,
+            "channel": params.channel,
         }
 
     def render_request(self, request: ActionRequest) -> dict[str, Any]:
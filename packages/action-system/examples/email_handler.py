@@ -15,6 +15,7 @@ class EmailHandler(ActionHandler):
 
     handler_id = "email"
     name = "Email"
+    is_fast = False  # real sends go over the network
     permissions = [
         PermissionDef(
             name="send_email",
@@ -27,15 +28,10 @@ class EmailHandler(ActionHandler):
             parameters={},
         ),
     ]
-
-    def get_required_permission(
-        self, action_name: str, params: dict[str, Any]
-    ) -> tuple[str, dict[str, Any]]:
-        if action_name == "send":
-            return "send_email", {"recipient": params.get("to", "")}
-        elif action_name == "read":
-            return "read_inbox", {}
-        return super().get_required_permission(action_name, params)
+    permission_map = {
+        "send": lambda params: ("send_email", {"recipient": params.get("to", "")}),
+        "read": lambda params: ("read_inbox", {}),
+    }
 
     def execute(self, action_name: str, params: dict[str, Any]) -> Any:
         if action_name == "send":
@@ -2,21 +2,24 @@
 
 from __future__ import annotations
 
+import dataclasses
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
 from .exceptions import (
     ActionNotFoundError,
     HandlerExecutionError,
     HandlerNotFoundError,
 )
-from .handler import ActionHandler
+from .handler import ActionHandler, PermissionResolver
 from .models import (
     ActionRequest,
     ActionResult,
     ActionStatus,
     Expiration,
+    PermissionDef,
     PermissionGrant,
 )
 from .notifications import (
@@ -29,6 +32,51 @@ from .notifications import (
 from .permissions import PermissionManager
 from .store import Store
 
+# (action_name, params) -> (permission_name, scope)
+_PermissionLookup = Callable[[str, dict[str, Any]], tuple[str, dict[str, Any]]]
+
+
+def _build_permission_lookup(handler: ActionHandler) -> _PermissionLookup:
+    """Specialize permission resolution for a handler at registration time."""
+    fallback = handler.get_required_permission
+    overridden = (
+        type(handler).get_required_permission
+        is not ActionHandler.get_required_permission
+    )
+    if handler.permission_map and not overridden:
+        resolvers: dict[str, PermissionResolver] = dict(handler.permission_map)
+
+        def lookup(action_name: str, params: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+            resolver = resolvers.get(action_name)
+            if resolver is None:
+                return fallback(action_name, params)
+            return resolver(params)
+
+        return lookup
+    if not overridden and handler.permissions:
+        # The default ignores the action: always the first permission, no scope.
+        perm_name = handler.permissions[0].name
+        return lambda action_name, params: (perm_name, {})
+    return fallback
+
+
+# params dict -> whatever the handler's execute() expects
+_ParamsParser = Callable[[dict[str, Any]], Any]
+
+
+def _build_params_parser(handler: ActionHandler) -> _ParamsParser | None:
+    """Return a parser casting params to ``handler.params_schema``, if declared."""
+    schema = handler.params_schema
+    if schema is None:
+        return None
+    names = frozenset(f.name for f in dataclasses.fields(schema))
+
+    def parse(params: dict[str, Any]) -> Any:
+        # Unknown keys are dropped, as handlers reading the dict would ignore them
+        return schema(**{k: v for k, v in params.items() if k in names})
+
+    return parse
+
 
 class ActionSystem:
     """Main entry point for the action/permission system.
@@ -37,14 +85,22 @@ class ActionSystem:
     Actions are executed immediately if permitted, or enqueued for approval.
     """
 
-    def __init__(self, db_path: str | Path = ":memory:") -> None:
+    def __init__(
+        self, db_path: str | Path = ":memory:", async_events: bool = False
+    ) -> None:
         self._store = Store(db_path)
         self._permissions = PermissionManager(self._store)
         self._handlers: dict[str, ActionHandler] = {}
-        self.events = EventBus()
+        self._permission_lookups: dict[str, _PermissionLookup] = {}
+        self._permission_defs: dict[str, dict[str, PermissionDef]] = {}
+        self._tool_schemas: dict[str, dict[str, Any]] = {}
+        self._params_parsers: dict[str, _ParamsParser | None] = {}
+        self._handler_execute: dict[str, Callable[[str, Any], Any]] = {}
+        self.events = EventBus(async_dispatch=async_events)
 
     def close(self) -> None:
-        """Close the backing store."""
+        """Deliver queued events, flush queued writes and close the store."""
+        self.events.close()
         self._store.close()
 
     # ── Handler Registration ──
@@ -55,6 +111,15 @@ class ActionSystem:
         for perm in handler.permissions:
             perm.handler_id = handler.handler_id
         self._handlers[handler.handler_id] = handler
+        self._permission_lookups[handler.handler_id] = _build_permission_lookup(
+            handler
+        )
+        self._permission_defs[handler.handler_id] = {
+            p.name: p for p in handler.permissions
+        }
+        self._tool_schemas[handler.handler_id] = handler.as_tool_schema()
+        self._params_parsers[handler.handler_id] = _build_params_parser(handler)
+        self._handler_execute[handler.handler_id] = handler.execute
 
     def get_handler(self, handler_id: str) -> ActionHandler:
         try:
@@ -65,6 +130,12 @@ class ActionSystem:
     def list_handlers(self) -> list[ActionHandler]:
         return list(self._handlers.values())
 
+    def get_permission_def(
+        self, handler_id: str, permission_name: str
+    ) -> PermissionDef | None:
+        """Return a registered handler's permission definition by name."""
+        return self._permission_defs.get(handler_id, {}).get(permission_name)
+
     # ── Action Requests ──
 
     def request_action(
@@ -76,25 +147,30 @@ class ActionSystem:
         """Request an action. Executes immediately if permitted, otherwise enqueues."""
         params = params or {}
         handler = self.get_handler(handler_id)
+        now = datetime.now(timezone.utc)
 
         # Determine required permission
-        perm_name, perm_scope = handler.get_required_permission(action_name, params)
+        perm_name, perm_scope = self._permission_lookups[handler_id](
+            action_name, params
+        )
 
-        # Create the action request
+        # Check permission before building the request, so its initial
+        # status is already the one we'll act on
+        permitted = self._permissions.check(handler_id, perm_name, perm_scope, now=now)
         request = ActionRequest(
             handler_id=handler_id,
             action_name=action_name,
             params=params,
             permission_name=perm_name,
             permission_scope=perm_scope,
+            status=ActionStatus.RUNNING if permitted else ActionStatus.PENDING,
+            created_at=now,
         )
 
-        # Check permission
-        if self._permissions.check(handler_id, perm_name, perm_scope):
+        if permitted:
             return self._execute(handler, request)
         else:
             # Enqueue for approval
-            request.status = ActionStatus.PENDING
             self._store.save_action(request)
             self.events.emit(
                 ACTION_ENQUEUED, action=request, handler=handler
@@ -114,38 +190,89 @@ class ActionSystem:
     def _execute(
         self, handler: ActionHandler, request: ActionRequest
     ) -> ActionResult:
-        """Execute a handler action and persist the result."""
+        """Execute a handler action and persist the result.
+
+        Handlers that opt in with ``is_fast = True`` run inside one
+        transaction and only the terminal row is written. Others commit a
+        RUNNING row first so observers can see the action in flight, and
+        run outside any transaction.
+        """
         request.status = ActionStatus.RUNNING
+        if handler.is_fast:
+            with self._store.transaction():
+                return self._run(handler, request, running_saved=False)
         self._store.save_action(request)
+        return self._run(handler, request, running_saved=True)
+
+    def _run(
+        self, handler: ActionHandler, request: ActionRequest, running_saved: bool
+    ) -> ActionResult:
+        error = self._invoke(request)
+        self._save_terminal(request, running_saved)
+        return self._finish(handler, request, error)
+
+    def _invoke(self, request: ActionRequest) -> Exception | None:
+        """Call the handler and record the outcome on ``request``."""
         try:
-            result = handler.execute(request.action_name, request.params)
+            parse = self._params_parsers.get(request.handler_id)
+            params = parse(request.params) if parse else request.params
+            execute = self._handler_execute[request.handler_id]
+            request.result = execute(request.action_name, params)
             request.status = ActionStatus.COMPLETED
-            request.result = result
-            request.completed_at = datetime.now(timezone.utc)
-            self._store.save_action(request)
-            self.events.emit(ACTION_COMPLETED, action=request, handler=handler)
-            return ActionResult(
-                action_id=request.id,
-                status=ActionStatus.COMPLETED,
-                result=result,
-            )
+            error = None
         except Exception as exc:
             request.status = ActionStatus.FAILED
             request.error = str(exc)
-            request.completed_at = datetime.now(timezone.utc)
-            self._store.save_action(request)
-            self.events.emit(ACTION_FAILED, action=request, handler=handler, error=exc)
+            error = exc
+        request.completed_at = datetime.now(timezone.utc)
+        return error
+
+    def _finish(
+        self, handler: ActionHandler, request: ActionRequest, error: Exception | None
+    ) -> ActionResult:
+        """Emit the terminal event for a persisted action."""
+        if error is None:
+            self.events.emit(ACTION_COMPLETED, action=request, handler=handler)
             return ActionResult(
                 action_id=request.id,
-                status=ActionStatus.FAILED,
-                error=str(exc),
+                status=ActionStatus.COMPLETED,
+                result=request.result,
             )
+        self.events.emit(ACTION_FAILED, action=request, handler=handler, error=error)
+        return ActionResult(
+            action_id=request.id,
+            status=ActionStatus.FAILED,
+            error=request.error,
+        )
 
-    def approve_action(self, action_id: str) -> ActionResult:
-        """Approve and execute a pending action.
+    def _save_terminal(self, request: ActionRequest, running_saved: bool) -> None:
+        if running_saved:
+            self._store.update_action_status(
+                request.id,
+                request.status,
+                request.result,
+                request.error,
+                request.completed_at,
+            )
+        else:
+            # The row may not exist yet (permitted on first request)
+            self._store.save_action(request)
 
-        Call this after the user has granted the required permission.
-        """
+    def _current_result(self, action_id: str) -> ActionResult:
+        request = self._store.get_action(action_id)
+        if request is None:
+            raise ActionNotFoundError(action_id)
+        return ActionResult(
+            action_id=request.id,
+            status=request.status,
+            result=request.result,
+            error=request.error,
+        )
+
+    def _approvable(
+        self, action_id: str
+    ) -> tuple[ActionHandler, ActionRequest] | ActionResult:
+        """Return the handler and request to run, or the result to report."""
         request = self._store.get_action(action_id)
         if request is None:
             raise ActionNotFoundError(action_id)
@@ -169,12 +296,60 @@ class ActionSystem:
                 status=ActionStatus.PENDING,
                 error="Permission still not granted",
             )
+        return handler, request
 
-        # Mark as approved before execution begins
-        request.status = ActionStatus.APPROVED
-        self._store.save_action(request)
+    def approve_action(self, action_id: str) -> ActionResult:
+        """Approve and execute a pending action.
+
+        Call this after the user has granted the required permission.
+        """
+        approvable = self._approvable(action_id)
+        if isinstance(approvable, ActionResult):
+            return approvable
+        handler, request = approvable
+
+        # Claim the action before execution begins so a racing approve (or
+        # grant auto-approve) can't run the handler twice; for fast handlers
+        # the claim commits together with the result
+        with self._store.transaction() if handler.is_fast else nullcontext():
+            if not self._store.claim_pending(request.id):
+                return self._current_result(request.id)
+            request.status = ActionStatus.APPROVED
+            return self._execute(handler, request)
+
+    def approve_actions(self, action_ids: Iterable[str]) -> list[ActionResult]:
+        """Approve and execute several pending actions.
 
-        return self._execute(handler, request)
+        Each action is claimed as in `approve_action()` and its handler runs
+        outside any transaction; the terminal rows are then committed
+        together in one transaction.
+        """
+        results: list[ActionResult] = []
+        done: list[tuple[int, ActionHandler, ActionRequest, Exception | None]] = []
+        try:
+            for action_id in action_ids:
+                approvable = self._approvable(action_id)
+                if isinstance(approvable, ActionResult):
+                    results.append(approvable)
+                    continue
+                handler, request = approvable
+                if not self._store.claim_pending(request.id):
+                    results.append(self._current_result(request.id))
+                    continue
+                request.status = ActionStatus.RUNNING
+                if not handler.is_fast:
+                    self._store.update_action_status(request.id, request.status)
+                error = self._invoke(request)
+                done.append((len(results), handler, request, error))
+                results.append(ActionResult(action_id=request.id, status=request.status))
+        finally:
+            # Claimed actions are recorded even if a later lookup raised
+            with self._store.transaction():
+                for _, _, request, _ in done:
+                    self._save_terminal(request, running_saved=True)
+        for index, handler, request, error in done:
+            results[index] = self._finish(handler, request, error)
+        return results
 
     def get_action_status(self, action_id: str) -> ActionRequest:
         request = self._store.get_action(action_id)
@@ -185,6 +360,12 @@ class ActionSystem:
     def get_pending_actions(self) -> list[ActionRequest]:
         return self._store.get_pending_actions()
 
+    def get_pending_for(
+        self, handler_id: str, permission_name: str
+    ) -> list[ActionRequest]:
+        """Return pending actions that need the given handler permission."""
+        return self._store.get_pending_for(handler_id, permission_name)
+
     # ── Permission Management ──
 
     def check_permission(
@@ -219,5 +400,8 @@ class ActionSystem:
     # ── Tool Schemas ──
 
     def get_tool_schemas(self) -> list[dict[str, Any]]:
-        """Return tool schemas for all registered handlers."""
-        return [h.as_tool_schema() for h in self._handlers.values()]
+        """Return tool schemas for all registered handlers.
+
+        Schemas are built once, when the handler is registered.
+        """
+        return list(self._tool_schemas.values())
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 
 from .models import ActionRequest, PermissionDef
 
+# Maps action params to the (permission_name, scope) the action requires.
+PermissionResolver = Callable[[dict[str, Any]], tuple[str, dict[str, Any]]]
 
-class ActionHandler(ABC):
+
+class ActionHandler:
     """Base class for action handlers.
 
     Subclasses must define:
@@ -16,25 +18,53 @@ class ActionHandler(ABC):
     - `name`: human-readable name
     - `permissions`: list of PermissionDefs this handler requires
     - `execute()`: perform the action
+
+    Optionally, `permission_map` maps action names to resolvers that return
+    the required (permission_name, scope); the system dispatches through it
+    instead of calling `get_required_permission()` for listed actions.
+
+    Set `is_fast = True` only for handlers whose `execute()` is short and
+    touches nothing but local state: they then run inside the store's write
+    transaction, so the action is written once, but every other writer waits
+    on them. Other handlers persist a RUNNING state while they execute.
+
+    Optionally, `params_schema` names a dataclass; `execute()` then receives
+    an instance of it, built once from the params dict, instead of the dict.
     """
 
     handler_id: str
     name: str
     permissions: list[PermissionDef]
+    permission_map: dict[str, PermissionResolver] | None = None
+    params_schema: type | None = None
+    is_fast: bool = False
 
-    @abstractmethod
-    def execute(self, action_name: str, params: dict[str, Any]) -> Any:
-        """Execute an action. Return the result."""
-        ...
+    def __new__(cls, *args: Any, **kwargs: Any) -> ActionHandler:
+        # Checked at instantiation, like an abstract method, so intermediate
+        # base classes sharing helpers don't need to define execute()
+        if cls.execute is ActionHandler.execute:
+            raise TypeError(
+                f"Can't instantiate {cls.__name__} without an execute() method"
+            )
+        return super().__new__(cls)
+
+    def execute(self, action_name: str, params: Any) -> Any:
+        """Execute an action. Return the result.
+
+        `params` is the params dict, or a `params_schema` instance if set.
+        """
+        raise NotImplementedError
 
     def get_required_permission(
         self, action_name: str, params: dict[str, Any]
     ) -> tuple[str, dict[str, Any]]:
         """Return (permission_name, scope) required for this action.
 
-        Override to implement custom permission logic. Default returns
-        the first permission with no scope.
+        Override (or set `permission_map`) to implement custom permission
+        logic. Default returns the first permission with no scope.
         """
+        if self.permission_map and action_name in self.permission_map:
+            return self.permission_map[action_name](params)
         if self.permissions:
             return self.permissions[0].name, {}
         raise ValueError(f"No permissions defined for handler {self.handler_id}")
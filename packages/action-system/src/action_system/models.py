@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-import uuid
+import secrets
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _new_id() -> str:
+    # 128 random bits as 32 hex chars, like uuid4().hex without the UUID object
+    return secrets.token_hex(16)
 
 
 class ActionStatus(Enum):
@@ -25,7 +33,8 @@ class Expiration(Enum):
     INDEFINITE = "indefinite"
 
 
-class PermissionDef(BaseModel):
+@dataclass(slots=True)
+class PermissionDef:
     """A permission defined by a handler.
 
     Permissions are fine-grained and parameterized. The `parameters` dict
@@ -36,19 +45,20 @@ class PermissionDef(BaseModel):
     name: str
     description: str
     handler_id: str = ""
-    parameters: dict[str, str] = Field(default_factory=dict)
+    parameters: dict[str, str] = field(default_factory=dict)
 
 
-class PermissionGrant(BaseModel):
+@dataclass(slots=True)
+class PermissionGrant:
     """A granted permission with optional scope and expiration."""
 
-    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    id: str = field(default_factory=_new_id)
     permission_name: str = ""
     handler_id: str = ""
-    scope: dict[str, Any] = Field(default_factory=dict)
+    scope: dict[str, Any] = field(default_factory=dict)
     expiration: Expiration = Expiration.INDEFINITE
     expires_at: datetime | None = None
-    granted_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    granted_at: datetime = field(default_factory=_utcnow)
     granted_by: str = "user"
 
     def is_expired(self) -> bool:
@@ -56,24 +66,42 @@ class PermissionGrant(BaseModel):
             return False
         return datetime.now(timezone.utc) >= self.expires_at
 
-
-class ActionRequest(BaseModel):
+    def covers(self, required_scope: dict[str, Any]) -> bool:
+        """Check if this grant's scope covers the required scope.
+
+        An empty grant scope is a wildcard — covers everything.
+        Otherwise, every key in the grant scope must appear in the required
+        scope with the same value.  This means a grant scoped to
+        ``{"recipient": "bob"}`` covers ``{"recipient": "bob", "priority": "high"}``
+        (the grant doesn't restrict priority), but a grant scoped to
+        ``{"recipient": "bob", "cc": "alice"}`` does NOT cover
+        ``{"recipient": "bob"}`` (the request doesn't satisfy the cc constraint).
+        """
+        for key, value in self.scope.items():
+            if required_scope.get(key) != value:
+                return False
+        return True
+
+
+@dataclass(slots=True)
+class ActionRequest:
     """A request to execute an action."""
 
-    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    id: str = field(default_factory=_new_id)
     handler_id: str = ""
     action_name: str = ""
-    params: dict[str, Any] = Field(default_factory=dict)
+    params: dict[str, Any] = field(default_factory=dict)
     permission_name: str = ""
-    permission_scope: dict[str, Any] = Field(default_factory=dict)
+    permission_scope: dict[str, Any] = field(default_factory=dict)
     status: ActionStatus = ActionStatus.PENDING
     result: Any = None
     error: str | None = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=_utcnow)
     completed_at: datetime | None = None
 
 
-class ActionResult(BaseModel):
+@dataclass(slots=True)
+class ActionResult:
     """Result returned from requesting an action."""
 
     action_id: str
@@ -2,34 +2,102 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import logging
+import queue
+import threading
 from typing import Any, Callable
 
+logger = logging.getLogger(__name__)
+
 EventCallback = Callable[..., None]
 
+# Queue item: (listeners snapshot, kwargs). None stops the worker.
+_Dispatch = tuple[tuple[EventCallback, ...], dict[str, Any]]
+
 
 class EventBus:
-    """Simple synchronous event bus with named events."""
+    """Simple event bus with named events.
+
+    Listener lists are stored as tuples and rebuilt on ``on``/``off``, so
+    ``emit`` iterates an immutable snapshot and returns after one dict
+    lookup when nothing is listening.
+
+    By default listeners run synchronously on the emitting thread. With
+    ``async_dispatch=True``, ``emit`` hands the call to a worker thread so
+    slow listeners don't delay the caller; ``emit_sync`` still calls
+    listeners inline.
+    """
 
-    def __init__(self) -> None:
-        self._listeners: dict[str, list[EventCallback]] = defaultdict(list)
+    def __init__(self, async_dispatch: bool = False) -> None:
+        self._listeners: dict[str, tuple[EventCallback, ...]] = {}
+        self._async = async_dispatch
+        self._queue: queue.SimpleQueue[_Dispatch | None] = queue.SimpleQueue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
 
     def on(self, event: str, callback: EventCallback) -> None:
         """Register a listener for an event."""
-        self._listeners[event].append(callback)
+        self._listeners[event] = self._listeners.get(event, ()) + (callback,)
 
     def off(self, event: str, callback: EventCallback) -> None:
         """Remove a listener."""
+        callbacks = list(self._listeners.get(event, ()))
         try:
-            self._listeners[event].remove(callback)
+            callbacks.remove(callback)
         except ValueError:
-            pass
+            return
+        if callbacks:
+            self._listeners[event] = tuple(callbacks)
+        else:
+            del self._listeners[event]
 
     def emit(self, event: str, **kwargs: Any) -> None:
         """Emit an event, calling all registered listeners."""
-        for callback in self._listeners.get(event, []):
+        callbacks = self._listeners.get(event)
+        if callbacks is None:
+            return
+        if not self._async:
+            for callback in callbacks:
+                callback(**kwargs)
+            return
+        self._ensure_worker()
+        self._queue.put((callbacks, kwargs))
+
+    def emit_sync(self, event: str, **kwargs: Any) -> None:
+        """Emit an event, calling listeners on this thread regardless of mode."""
+        for callback in self._listeners.get(event, ()):
             callback(**kwargs)
 
+    def close(self) -> None:
+        """Deliver queued events and stop the dispatch worker, if any."""
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="action-event-dispatch", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            callbacks, kwargs = item
+            for callback in callbacks:
+                try:
+                    callback(**kwargs)
+                except Exception:
+                    logger.exception("Event listener %r failed", callback)
+
 
 # Standard event names
 ACTION_ENQUEUED = "action_enqueued"
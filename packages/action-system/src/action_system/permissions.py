@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import math
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -9,8 +13,7 @@ from .models import Expiration, PermissionGrant
 from .store import Store
 
 
-def _compute_expires_at(expiration: Expiration) -> datetime | None:
-    now = datetime.now(timezone.utc)
+def _compute_expires_at(expiration: Expiration, now: datetime) -> datetime | None:
     match expiration:
         case Expiration.ONE_HOUR:
             return now + timedelta(hours=1)
@@ -21,47 +24,80 @@ def _compute_expires_at(expiration: Expiration) -> datetime | None:
             return None
 
 
-def _scope_matches(grant_scope: dict[str, Any], required_scope: dict[str, Any]) -> bool:
-    """Check if a grant's scope covers the required scope.
+_CHECK_CACHE_SIZE = 1024
 
-    An empty grant scope is a wildcard — covers everything.
-    Otherwise, every key in the grant scope must appear in the required
-    scope with the same value.  This means a grant scoped to
-    ``{"recipient": "bob"}`` covers ``{"recipient": "bob", "priority": "high"}``
-    (the grant doesn't restrict priority), but a grant scoped to
-    ``{"recipient": "bob", "cc": "alice"}`` does NOT cover
-    ``{"recipient": "bob"}`` (the request doesn't satisfy the cc constraint).
-    """
-    if not grant_scope:
-        return True
-    for key, value in grant_scope.items():
-        if required_scope.get(key) != value:
-            return False
-    return True
+_ScopeItems = frozenset[tuple[str, Any]]
+_CheckKey = tuple[str, str, _ScopeItems]
 
 
 class PermissionManager:
-    """Manages permission grants: check, grant, revoke."""
+    """Manages permission grants: check, grant, revoke.
+
+    ``check()`` results are kept in a small LRU keyed by
+    ``(handler_id, permission_name, scope)``.  A result is valid while the
+    store's version is unchanged, so grants and revokes made through any
+    connection to the database are seen; a positive result also lapses when
+    the matching grant expires.
+    """
 
     def __init__(self, store: Store) -> None:
         self._store = store
+        # key -> (decision, store version, valid-until on the time.monotonic() clock)
+        self._check_cache: OrderedDict[_CheckKey, tuple[bool, int, float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def check(
         self,
         handler_id: str,
         permission_name: str,
         scope: dict[str, Any] | None = None,
+        now: datetime | None = None,
     ) -> bool:
-        """Check if a permission is currently granted for the given scope."""
+        """Check if a permission is currently granted for the given scope.
+
+        Pass ``now`` to reuse a timestamp the caller already took.
+        """
         scope = scope or {}
-        grants = self._store.get_grants(handler_id, permission_name)
+        try:
+            req_items: _ScopeItems | None = frozenset(scope.items())
+        except TypeError:
+            req_items = None  # unhashable scope values; skip the cache
+        key = (handler_id, permission_name, req_items) if req_items is not None else None
+
+        if key is not None:
+            # Read before querying: a commit racing with the query moves the
+            # version on, so the decision below is never cached as current.
+            version = self._store.version
+            with self._cache_lock:
+                cached = self._check_cache.get(key)
+                if cached is not None:
+                    decision, cached_version, valid_until = cached
+                    if cached_version == version and time.monotonic() < valid_until:
+                        self._check_cache.move_to_end(key)
+                        return decision
+                    del self._check_cache[key]
+
+        decision = False
+        valid_until = math.inf
+        if now is None:
+            now = datetime.now(timezone.utc)
+        grants = self._store.get_active_grants(
+            handler_id, permission_name, now.isoformat()
+        )
         for grant in grants:
-            if grant.is_expired():
-                self._store.delete_grant(grant.id)
-                continue
-            if _scope_matches(grant.scope, scope):
-                return True
-        return False
+            if grant.covers(scope):
+                decision = True
+                if grant.expires_at is not None:
+                    remaining = grant.expires_at - now
+                    valid_until = time.monotonic() + remaining.total_seconds()
+                break
+
+        if key is not None:
+            with self._cache_lock:
+                self._check_cache[key] = (decision, version, valid_until)
+                if len(self._check_cache) > _CHECK_CACHE_SIZE:
+                    self._check_cache.popitem(last=False)
+        return decision
 
     def grant(
         self,
@@ -72,27 +108,37 @@ class PermissionManager:
         granted_by: str = "user",
     ) -> PermissionGrant:
         """Grant a permission. Only the human should call this."""
+        now = datetime.now(timezone.utc)
         grant = PermissionGrant(
             permission_name=permission_name,
             handler_id=handler_id,
             scope=scope or {},
             expiration=expiration,
-            expires_at=_compute_expires_at(expiration),
+            expires_at=_compute_expires_at(expiration, now),
+            granted_at=now,
             granted_by=granted_by,
         )
         self._store.save_grant(grant)
+        self._invalidate()
         return grant
 
     def revoke(self, grant_id: str) -> None:
         """Revoke a permission grant."""
         self._store.delete_grant(grant_id)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        # Entries are already stale by version; drop them to free the space
+        with self._cache_lock:
+            self._check_cache.clear()
 
     def get_all_grants(self) -> list[PermissionGrant]:
         """Return all active (non-expired) grants."""
         grants = self._store.get_all_grants()
+        now = datetime.now(timezone.utc)
         active: list[PermissionGrant] = []
         for grant in grants:
-            if grant.is_expired():
+            if grant.expires_at is not None and grant.expires_at <= now:
                 self._store.delete_grant(grant.id)
             else:
                 active.append(grant)
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-import json
+import gzip
+import hashlib
+import re
 from datetime import datetime, timedelta, timezone
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from typing import Any
-from urllib.parse import parse_qs, urlparse
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+import orjson
 
 from .core import ActionSystem
 from .models import ActionStatus, Expiration, PermissionGrant
@@ -15,64 +19,164 @@ from .models import ActionStatus, Expiration, PermissionGrant
 _system: ActionSystem | None = None
 
 
-def _json_response(handler: "_Handler", data: Any, status: int = 200) -> None:
-    body = json.dumps(data, default=str).encode()
-    handler.send_response(status)
-    handler.send_header("Content-Type", "application/json")
-    handler.send_header("Content-Length", str(len(body)))
-    handler.end_headers()
-    handler.wfile.write(body)
+# Encoded bodies of list endpoints, keyed by endpoint:
+# (store version, body, gzipped body or None if not yet needed)
+_response_cache: dict[str, tuple[int, bytes, bytes | None]] = {}
+
+# JSON bodies smaller than this are not worth compressing.
+_GZIP_MIN_SIZE = 512
+
+
+# orjson writes datetimes as ISO 8601 itself, matching isoformat().
+def _encode(data: Any) -> bytes:
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _accepts_gzip(handler: "_Handler") -> bool:
+    return "gzip" in handler.headers.get("Accept-Encoding", "")
 
 
-def _read_body(handler: "_Handler") -> dict[str, Any]:
+def _json_response(handler: "_Handler", data: Any, status: int = 200) -> None:
+    body = _encode(data)
+    if len(body) > _GZIP_MIN_SIZE and _accepts_gzip(handler):
+        _send_json(handler, gzip.compress(body, 1), status, gzipped=True)
+    else:
+        _send_json(handler, body, status)
+
+
+def _cached_json_response(
+    handler: "_Handler", key: str, build: Callable[[], Any]
+) -> None:
+    """Send ``build()`` as JSON, reusing the last body until the store changes."""
+    assert _system is not None
+    # Read the version before the data: a write landing in between then
+    # leaves a stale version behind, forcing a rebuild next time.
+    version = _system._store.version
+    cached = _response_cache.get(key)
+    if cached is not None and cached[0] == version:
+        _, body, gz_body = cached
+    else:
+        body, gz_body = _encode(build()), None
+    if len(body) > _GZIP_MIN_SIZE and _accepts_gzip(handler):
+        if gz_body is None:
+            gz_body = gzip.compress(body, 1)
+        _response_cache[key] = (version, body, gz_body)
+        _send_json(handler, gz_body, gzipped=True)
+        return
+    _response_cache[key] = (version, body, gz_body)
+    _send_json(handler, body)
+
+
+def _send_json(
+    handler: "_Handler", body: bytes, status: int = 200, gzipped: bool = False
+) -> None:
+    if gzipped:
+        _write_response(handler, status, _JSON_GZIP_HEADERS, body)
+    else:
+        _write_response(handler, status, _JSON_HEADERS, body)
+
+
+_REASONS = {s.value: s.phrase for s in HTTPStatus}
+
+_JSON_HEADERS = "Content-Type: application/json\r\nVary: Accept-Encoding\r\n"
+_JSON_GZIP_HEADERS = _JSON_HEADERS + "Content-Encoding: gzip\r\n"
+
+
+def _write_response(
+    handler: "_Handler", status: int, headers: str, body: bytes = b""
+) -> None:
+    """Send the status line, ``headers`` and ``body`` in a single write.
+
+    ``headers`` is preformatted ``Name: value\\r\\n`` lines; Content-Length
+    is added here except on 304 responses.
+    """
+    head = f"{handler.protocol_version} {status} {_REASONS.get(status, '')}\r\n{headers}"
+    if status != 304:
+        head += f"Content-Length: {len(body)}\r\n"
+    if handler.close_connection:
+        head += "Connection: close\r\n"
+    handler.wfile.write((head + "\r\n").encode("latin-1") + body)
+
+
+# Enum.value is a property; look the strings up once per status instead.
+_STATUS_VAL = {s: s.value for s in ActionStatus}
+
+_GET_ROUTES = [
+    (re.compile(r"/"), "html"),
+    (re.compile(r"/api/queue"), "queue"),
+    (re.compile(r"/api/queue/all"), "queue_all"),
+    (re.compile(r"/api/grants"), "grants"),
+    (re.compile(r"/api/permissions/([^/]+)"), "permissions"),
+    (re.compile(r"/api/handlers"), "handlers"),
+]
+
+_POST_ROUTES = [
+    (re.compile(r"/api/grant"), "grant"),
+    (re.compile(r"/api/approve/([^/]+)"), "approve"),
+    (re.compile(r"/api/revoke/([^/]+)"), "revoke"),
+]
+
+
+def _route(
+    routes: list[tuple[re.Pattern[str], str]], raw_path: str
+) -> tuple[str | None, str | None]:
+    """Match a request path (query string ignored) to ``(route, id)``."""
+    path = raw_path.partition("?")[0]
+    for pattern, name in routes:
+        m = pattern.fullmatch(path)
+        if m is not None:
+            return name, m.group(1) if pattern.groups else None
+    return None, None
+
+
+def _read_body(handler: "_Handler") -> bytes:
+    # Always consumed, whatever the route: on a keep-alive connection unread
+    # body bytes would be parsed as the start of the next request.
     length = int(handler.headers.get("Content-Length", 0))
-    if length == 0:
-        return {}
-    return json.loads(handler.rfile.read(length))
+    if length <= 0:
+        return b""
+    return handler.rfile.read(length)
 
 
 class _Handler(BaseHTTPRequestHandler):
+    # Keep-alive lets the UI's pollers reuse their connection; idle ones
+    # are dropped after the timeout so they don't pin a thread forever.
+    protocol_version = "HTTP/1.1"
+    timeout = 60
+
     def log_message(self, format: str, *args: Any) -> None:
         pass  # quiet
 
     def do_GET(self) -> None:
         assert _system is not None
-        parsed = urlparse(self.path)
-        path = parsed.path
-        qs = parse_qs(parsed.query)
+        route, item_id = _route(_GET_ROUTES, self.path)
 
-        if path == "/":
+        if route == "html":
             self._serve_html()
-        elif path == "/api/queue":
-            items = _system.get_pending_actions()
-            _json_response(self, [self._serialize_action(a) for a in items])
-        elif path == "/api/queue/all":
-            # Return all items from the store
-            all_items = []
-            for status in ActionStatus:
-                all_items.extend(_system._store.get_actions_by_status(status))
-            all_items.sort(key=lambda a: a.created_at, reverse=True)
-            _json_response(self, [self._serialize_action(a) for a in all_items[:50]])
-        elif path == "/api/grants":
+        elif route == "queue":
+            _cached_json_response(self, "queue", lambda: [
+                self._serialize_action(a) for a in _system.get_pending_actions()
+            ])
+        elif route == "queue_all":
+            # Return the most recent items from the store
+            _cached_json_response(self, "queue_all", lambda: [
+                self._serialize_action(a) for a in _system._store.get_recent_actions(50)
+            ])
+        elif route == "grants":
             grants = _system.get_all_grants()
             _json_response(self, [self._serialize_grant(g) for g in grants])
-        elif path.startswith("/api/permissions/"):
-            item_id = path.split("/")[-1]
+        elif route == "permissions":
             try:
                 action = _system.get_action_status(item_id)
             except Exception:
                 _json_response(self, {"error": "not found"}, 404)
                 return
-            handler = _system._handlers.get(action.handler_id)
             granted = _system.check_permission(
                 action.handler_id, action.permission_name, action.permission_scope
             )
-            perm_def = None
-            if handler:
-                for p in handler.permissions:
-                    if p.name == action.permission_name:
-                        perm_def = p
-                        break
+            perm_def = _system.get_permission_def(
+                action.handler_id, action.permission_name
+            )
             _json_response(self, {
                 "item_id": item_id,
                 "handler_id": action.handler_id,
@@ -84,7 +188,7 @@ class _Handler(BaseHTTPRequestHandler):
                     "parameters": perm_def.parameters if perm_def else {},
                 }] if action.permission_name else [],
             })
-        elif path == "/api/handlers":
+        elif route == "handlers":
             handlers = _system.list_handlers()
             _json_response(self, [
                 {
@@ -102,10 +206,11 @@ class _Handler(BaseHTTPRequestHandler):
 
     def do_POST(self) -> None:
         assert _system is not None
-        path = urlparse(self.path).path
+        raw = _read_body(self)
+        route, item_id = _route(_POST_ROUTES, self.path)
 
-        if path == "/api/grant":
-            body = _read_body(self)
+        if route == "grant":
+            body = orjson.loads(raw) if raw else {}
             handler_id = body["handler_id"]
             permission_name = body["permission_name"]
             scope = body.get("scope", {})
@@ -113,37 +218,37 @@ class _Handler(BaseHTTPRequestHandler):
             grant = _system.grant_permission(
                 handler_id, permission_name, scope, expiration
             )
-            # Auto-approve any pending actions that now have permission
-            for action in _system.get_pending_actions():
-                if (action.handler_id == handler_id
-                        and action.permission_name == permission_name
-                        and _system.check_permission(handler_id, permission_name, action.permission_scope)):
-                    _system.approve_action(action.id)
+            # Auto-approve any pending actions that now have permission; the
+            # handlers run outside the write transaction and their results
+            # are committed together afterwards.
+            _system.approve_actions(_system._store.find_actions_covered_by(grant))
             _json_response(self, self._serialize_grant(grant))
 
-        elif path.startswith("/api/approve/"):
-            item_id = path.split("/")[-1]
+        elif route == "approve":
             try:
                 result = _system.approve_action(item_id)
                 _json_response(self, {"status": result.status.value, "result": result.result})
             except Exception as e:
                 _json_response(self, {"error": str(e)}, 400)
 
-        elif path.startswith("/api/revoke/"):
-            grant_id = path.split("/")[-1]
-            _system.revoke_permission(grant_id)
+        elif route == "revoke":
+            _system.revoke_permission(item_id)
             _json_response(self, {"status": "ok"})
 
         else:
             self.send_error(404)
 
     def _serve_html(self) -> None:
-        body = _HTML.encode()
-        self.send_response(200)
-        self.send_header("Content-Type", "text/html")
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
+        if _accepts_gzip(self):
+            body, etag = _HTML_GZ, _HTML_GZ_ETAG
+            headers = _HTML_HEADERS + "Content-Encoding: gzip\r\n"
+        else:
+            body, etag, headers = _HTML_BYTES, _HTML_ETAG, _HTML_HEADERS
+        headers += f"ETag: {etag}\r\n"
+        if self.headers.get("If-None-Match") == etag:
+            _write_response(self, 304, headers)
+            return
+        _write_response(self, 200, headers, body)
 
     @staticmethod
     def _serialize_action(a: Any) -> dict[str, Any]:
@@ -154,11 +259,11 @@ class _Handler(BaseHTTPRequestHandler):
             "params": a.params,
             "permission_name": a.permission_name,
             "permission_scope": a.permission_scope,
-            "status": a.status.value,
+            "status": _STATUS_VAL[a.status],
             "result": a.result,
             "error": a.error,
-            "created_at": a.created_at.isoformat() if a.created_at else None,
-            "completed_at": a.completed_at.isoformat() if a.completed_at else None,
+            "created_at": a.created_at,
+            "completed_at": a.completed_at,
         }
 
     @staticmethod
@@ -169,8 +274,8 @@ class _Handler(BaseHTTPRequestHandler):
             "permission_name": g.permission_name,
             "scope": g.scope,
             "expiration": g.expiration.value,
-            "expires_at": g.expires_at.isoformat() if g.expires_at else None,
-            "granted_at": g.granted_at.isoformat(),
+            "expires_at": g.expires_at,
+            "granted_at": g.granted_at,
             "granted_by": g.granted_by,
         }
 
@@ -179,7 +284,8 @@ def serve(system: ActionSystem, host: str = "0.0.0.0", port: int = 8991) -> None
     """Start the action system web UI."""
     global _system
     _system = system
-    server = HTTPServer((host, port), _Handler)
+    _response_cache.clear()
+    server = ThreadingHTTPServer((host, port), _Handler)
     print(f"Action System UI: http://{host}:{port}")
     server.serve_forever()
 
@@ -378,3 +484,10 @@ setInterval(loadContent, 5000);
 </body>
 </html>
 """
+
+# The page is static: encode and compress it and derive validators once.
+_HTML_BYTES = _HTML.encode("utf-8")
+_HTML_ETAG = '"' + hashlib.blake2b(_HTML_BYTES, digest_size=8).hexdigest() + '"'
+_HTML_GZ = gzip.compress(_HTML_BYTES, 9, mtime=0)
+_HTML_GZ_ETAG = _HTML_ETAG[:-1] + '-gzip"'
+_HTML_HEADERS = "Content-Type: text/html; charset=utf-8\r\nVary: Accept-Encoding\r\n"
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
-import json
+import queue
+import re
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .models import (
     ActionRequest,
     ActionStatus,
@@ -17,10 +26,10 @@ from .models import (
 
 _SCHEMA = """
 CREATE TABLE IF NOT EXISTS permission_grants (
-    id TEXT PRIMARY KEY,
+    id BLOB PRIMARY KEY,
     permission_name TEXT NOT NULL,
     handler_id TEXT NOT NULL,
-    scope TEXT NOT NULL DEFAULT '{}',
+    scope BLOB NOT NULL DEFAULT '{}',
     expiration TEXT NOT NULL DEFAULT 'indefinite',
     expires_at TEXT,
     granted_at TEXT NOT NULL,
@@ -28,27 +37,149 @@ CREATE TABLE IF NOT EXISTS permission_grants (
 );
 
 CREATE TABLE IF NOT EXISTS action_requests (
-    id TEXT PRIMARY KEY,
+    id BLOB PRIMARY KEY,
     handler_id TEXT NOT NULL,
     action_name TEXT NOT NULL,
-    params TEXT NOT NULL DEFAULT '{}',
+    params BLOB NOT NULL DEFAULT '{}',
     permission_name TEXT NOT NULL DEFAULT '',
-    permission_scope TEXT NOT NULL DEFAULT '{}',
+    permission_scope BLOB NOT NULL DEFAULT '{}',
     status TEXT NOT NULL DEFAULT 'pending',
-    result TEXT,
+    result BLOB,
     error TEXT,
     created_at TEXT NOT NULL,
     completed_at TEXT
 );
 
-CREATE INDEX IF NOT EXISTS idx_grants_lookup
-    ON permission_grants(handler_id, permission_name);
+DROP INDEX IF EXISTS idx_grants_lookup;
+
+CREATE INDEX IF NOT EXISTS idx_grants_active
+    ON permission_grants(handler_id, permission_name, expires_at);
+
+DROP INDEX IF EXISTS idx_requests_status;
+
+-- Serves the status filters together with their ORDER BY created_at.
+CREATE INDEX IF NOT EXISTS idx_requests_status_created
+    ON action_requests(status, created_at);
+
+CREATE INDEX IF NOT EXISTS idx_requests_created
+    ON action_requests(created_at DESC);
 
-CREATE INDEX IF NOT EXISTS idx_requests_status
-    ON action_requests(status);
+CREATE INDEX IF NOT EXISTS idx_requests_pending_handler
+    ON action_requests(handler_id, permission_name, created_at)
+    WHERE status = 'pending';
 """
 
 
+_SAVE_GRANT_SQL = """INSERT OR REPLACE INTO permission_grants
+   (id, permission_name, handler_id, scope, expiration, expires_at, granted_at, granted_by)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_SAVE_ACTION_SQL = """INSERT OR REPLACE INTO action_requests
+   (id, handler_id, action_name, params, permission_name, permission_scope,
+    status, result, error, created_at, completed_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_DELETE_EXPIRED_GRANTS_SQL = """DELETE FROM permission_grants
+   WHERE expires_at IS NOT NULL AND expires_at <= ?"""
+
+_UPDATE_ACTION_STATUS_SQL = """UPDATE action_requests
+   SET status = ?, result = ?, error = ?, completed_at = ?
+   WHERE id = ?"""
+
+_CLAIM_PENDING_SQL = """UPDATE action_requests
+   SET status = 'approved'
+   WHERE id = ? AND status = 'pending'"""
+
+# Walks idx_requests_created, so only ``limit`` rows are ever read.
+_RECENT_ACTIONS_SQL = """SELECT * FROM action_requests
+   ORDER BY created_at DESC LIMIT ?"""
+
+# WAL lets readers (e.g. the pending-queue view) proceed while a write is in
+# flight; only meaningful for file-backed databases.
+_FILE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Applied to pooled read connections.
+_READER_PRAGMAS = (
+    "PRAGMA query_only=1",
+    "PRAGMA busy_timeout=30000",
+)
+
+_DEFAULT_READ_POOL_SIZE = 4
+
+# Background writer: queued writes are committed together, up to this many
+# per transaction.  A non-zero wait lingers for more writes after the first.
+_DEFAULT_BATCH_SIZE = 500
+_DEFAULT_BATCH_WAIT_MS = 0.0
+
+# How often the writer thread deletes expired grants.
+_SWEEP_INTERVAL_S = 60.0
+
+# Rows kept by get_action, keyed by id, for repeat lookups of the same action.
+_ACTION_CACHE_SIZE = 256
+
+# Queue item: (sql, params, future). A None sql is a flush barrier.
+_WriteItem = tuple[str | None, tuple[Any, ...], Future]
+
+# sqlite3 caches prepared statements keyed by SQL text; keep the SQL above
+# stable and the cache large enough to hold every statement we issue.
+_CACHED_STATEMENTS = 256
+
+
+# JSON columns hold orjson output (UTF-8 bytes); rows written as text by
+# older versions still load since orjson.loads accepts both.
+_ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+# Most scopes and many params are empty; skip serializing those.
+_EMPTY_OBJECT = b"{}"
+
+
+def _dumps(obj: Any) -> bytes:
+    if type(obj) is dict and not obj:
+        return _EMPTY_OBJECT
+    return orjson.dumps(obj, option=_ORJSON_OPTS)
+
+
+_loads = orjson.loads
+
+
+def _loads_object(raw: bytes | str | None) -> Any:
+    # Empty objects are the common case for scopes; skip the parser and
+    # return a fresh dict so rows never share one.
+    if not raw or raw == _EMPTY_OBJECT or raw == "{}":
+        return {}
+    return orjson.loads(raw)
+
+
+# Plain dict lookups avoid Enum.__call__ when hydrating rows.
+_STATUS_BY_VALUE = {s.value: s for s in ActionStatus}
+_EXPIRATION_BY_VALUE = {e.value: e for e in Expiration}
+
+
+# Generated ids (32 lowercase hex chars) are stored as 16-byte blobs; any
+# other caller-supplied id is stored as text unchanged.
+_HEX_ID = re.compile(r"[0-9a-f]{32}")
+
+
+def _encode_id(id_: str) -> bytes | str:
+    if _HEX_ID.fullmatch(id_):
+        return bytes.fromhex(id_)
+    return id_
+
+
+def _decode_id(value: bytes | str) -> str:
+    if isinstance(value, bytes):
+        return value.hex()
+    return value
+
+
 def _dt_to_str(dt: datetime | None) -> str | None:
     if dt is None:
         return None
@@ -62,63 +193,322 @@ def _str_to_dt(s: str | None) -> datetime | None:
 
 
 class Store:
-    """SQLite-backed persistence for grants and action requests."""
+    """SQLite-backed persistence for grants and action requests.
 
-    def __init__(self, db_path: str | Path = ":memory:") -> None:
-        self._conn = sqlite3.connect(str(db_path))
-        self._conn.row_factory = sqlite3.Row
-        self._conn.executescript(_SCHEMA)
+    File-backed stores use one writer connection, serialized by a lock, and
+    a pool of read-only connections so reads do not queue behind writes.
+    In-memory stores are private to a single connection, so reads share
+    the writer there.
+
+    Writes outside an explicit ``transaction()`` are handed to a background
+    writer thread that commits whatever has queued up in one transaction.
+    The plain ``save_*`` methods block until their write is committed; the
+    ``*_async`` variants return a ``Future`` instead.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = ":memory:",
+        read_pool_size: int = _DEFAULT_READ_POOL_SIZE,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        batch_wait_ms: float = _DEFAULT_BATCH_WAIT_MS,
+    ) -> None:
+        db_path = str(db_path)
+        in_memory = db_path == ":memory:"
+        self._writer = self._connect(db_path)
+        if not in_memory:
+            for pragma in _FILE_PRAGMAS:
+                self._writer.execute(pragma)
+        self._writer.executescript(_SCHEMA)
+        self._migrate_text_ids()
+        self._write_lock = threading.RLock()
+        self._txn_depth = 0
+        self._txn_owner: int | None = None
+        self._version = 0
+        self._version_lock = threading.Lock()
+        # Other processes (or Stores) sharing a database file commit without
+        # touching our counter; PRAGMA data_version on a connection that never
+        # writes changes whenever any other connection commits.
+        self._watcher = None if in_memory else self._connect(db_path)
+        if self._watcher is not None:
+            for pragma in _READER_PRAGMAS:
+                self._watcher.execute(pragma)
+        self._data_version = self._read_data_version()
+        # id -> (store version when read, row); stale once the version moves
+        self._action_cache: OrderedDict[str, tuple[int, sqlite3.Row]] = OrderedDict()
+        self._action_cache_lock = threading.Lock()
+
+        self._readers: list[sqlite3.Connection] = []
+        self._read_pool: queue.Queue[sqlite3.Connection] = queue.Queue()
+        if not in_memory:
+            for _ in range(read_pool_size):
+                conn = self._connect(db_path)
+                for pragma in _READER_PRAGMAS:
+                    conn.execute(pragma)
+                self._readers.append(conn)
+                self._read_pool.put(conn)
+
+        self._batch_size = batch_size
+        self._batch_wait = batch_wait_ms / 1000
+        self._write_queue: queue.SimpleQueue[_WriteItem | None] = queue.SimpleQueue()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="action-store-writer", daemon=True
+        )
+        self._writer_thread.start()
+
+    def _migrate_text_ids(self) -> None:
+        # Databases created before ids were stored as blobs hold hex text.
+        for table in ("permission_grants", "action_requests"):
+            rows = self._writer.execute(
+                f"SELECT id FROM {table} WHERE typeof(id) = 'text' AND length(id) = 32"
+            ).fetchall()
+            updates = [
+                (_encode_id(r[0]), r[0]) for r in rows if _HEX_ID.fullmatch(r[0])
+            ]
+            if updates:
+                with self._writer:
+                    self._writer.execute("BEGIN")
+                    self._writer.executemany(
+                        f"UPDATE {table} SET id = ? WHERE id = ?", updates
+                    )
+
+    @staticmethod
+    def _connect(db_path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            db_path,
+            cached_statements=_CACHED_STATEMENTS,
+            check_same_thread=False,
+            # Autocommit: every transaction is opened explicitly with BEGIN,
+            # so the module never starts one implicitly behind our back.
+            isolation_level=None,
+        )
+        conn.row_factory = sqlite3.Row
+        return conn
 
     def close(self) -> None:
-        self._conn.close()
+        """Flush queued writes, stop the writer thread and close connections."""
+        if self._writer_thread.is_alive():
+            self._write_queue.put(None)
+            self._writer_thread.join()
+        for conn in self._readers:
+            conn.close()
+        if self._watcher is not None:
+            self._watcher.close()
+        self._writer.close()
+
+    @contextmanager
+    def _checkout_reader(self) -> Iterator[sqlite3.Connection]:
+        # Reads inside our own open transaction must see its uncommitted
+        # writes, so they go through the writer.
+        if not self._readers or self._txn_owner == threading.get_ident():
+            with self._write_lock:
+                yield self._writer
+            return
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into a single ``BEGIN IMMEDIATE ... COMMIT``.
+
+        Nested uses join the outermost transaction. Rolls back if the
+        block raises.
+        """
+        with self._write_lock:
+            if self._txn_depth:
+                self._txn_depth += 1
+                try:
+                    yield
+                finally:
+                    self._txn_depth -= 1
+                return
+            self._writer.execute("BEGIN IMMEDIATE")
+            self._txn_depth = 1
+            self._txn_owner = threading.get_ident()
+            try:
+                yield
+            except BaseException:
+                self._writer.rollback()
+                raise
+            else:
+                self._writer.commit()
+                self._bump_version()
+            finally:
+                self._txn_depth = 0
+                self._txn_owner = None
+
+    def _read_data_version(self) -> int:
+        if self._watcher is None:
+            return 0
+        return self._watcher.execute("PRAGMA data_version").fetchone()[0]
+
+    def _bump_version(self) -> None:
+        with self._version_lock:
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter bumped after every committed write.
+
+        For file-backed stores this includes commits made through other
+        connections to the same database, such as another process. Lets
+        callers cache anything derived from the store's contents and
+        rebuild it only once the version moves on.
+        """
+        if self._watcher is not None:
+            with self._version_lock:
+                data_version = self._read_data_version()
+                if data_version != self._data_version:
+                    self._data_version = data_version
+                    self._version += 1
+        return self._version
+
+    def flush(self) -> None:
+        """Block until every write queued so far has been committed."""
+        barrier: Future = Future()
+        self._write_queue.put((None, (), barrier))
+        barrier.result()
+
+    def _write_async(self, sql: str, params: tuple[Any, ...]) -> Future:
+        future: Future = Future()
+        # Writes issued inside our own open transaction belong to it; the
+        # writer thread could not take the lock until it ends anyway.
+        if self._txn_owner == threading.get_ident():
+            self._writer.execute(sql, params)
+            future.set_result(None)
+        else:
+            self._write_queue.put((sql, params, future))
+        return future
+
+    def _write(self, sql: str, params: tuple[Any, ...]) -> None:
+        self._write_async(sql, params).result()
+
+    def _writer_loop(self) -> None:
+        next_sweep = time.monotonic() + _SWEEP_INTERVAL_S
+        while True:
+            try:
+                item = self._write_queue.get(
+                    timeout=max(0.0, next_sweep - time.monotonic())
+                )
+            except queue.Empty:
+                now = _dt_to_str(datetime.now(timezone.utc))
+                self._commit_batch([(_DELETE_EXPIRED_GRANTS_SQL, (now,), Future())])
+                next_sweep = time.monotonic() + _SWEEP_INTERVAL_S
+                continue
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self._batch_wait
+            while len(batch) < self._batch_size:
+                try:
+                    timeout = deadline - time.monotonic()
+                    if timeout > 0:
+                        nxt = self._write_queue.get(timeout=timeout)
+                    else:
+                        nxt = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                batch.append(nxt)
+            self._commit_batch(batch)
+            if stop:
+                return
+
+    def _commit_batch(self, batch: list[_WriteItem]) -> None:
+        done: list[Future] = []
+        with self._write_lock:
+            try:
+                self._writer.execute("BEGIN IMMEDIATE")
+                for sql, params, future in batch:
+                    if sql is None:
+                        done.append(future)
+                        continue
+                    try:
+                        self._writer.execute(sql, params)
+                    except sqlite3.Error as exc:
+                        future.set_exception(exc)
+                    else:
+                        done.append(future)
+                self._writer.commit()
+                self._bump_version()
+            except sqlite3.Error as exc:
+                if self._writer.in_transaction:
+                    self._writer.rollback()
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                return
+        for future in done:
+            future.set_result(None)
 
     # ── Permission Grants ──
 
     def save_grant(self, grant: PermissionGrant) -> None:
-        self._conn.execute(
-            """INSERT OR REPLACE INTO permission_grants
-               (id, permission_name, handler_id, scope, expiration, expires_at, granted_at, granted_by)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        self._write(
+            _SAVE_GRANT_SQL,
             (
-                grant.id,
+                _encode_id(grant.id),
                 grant.permission_name,
                 grant.handler_id,
-                json.dumps(grant.scope),
+                _dumps(grant.scope),
                 grant.expiration.value,
                 _dt_to_str(grant.expires_at),
                 _dt_to_str(grant.granted_at),
                 grant.granted_by,
             ),
         )
-        self._conn.commit()
 
     def get_grants(
         self, handler_id: str, permission_name: str
     ) -> list[PermissionGrant]:
-        rows = self._conn.execute(
-            """SELECT * FROM permission_grants
-               WHERE handler_id = ? AND permission_name = ?""",
-            (handler_id, permission_name),
-        ).fetchall()
+        with self._checkout_reader() as conn:
+            rows = conn.execute(
+                """SELECT * FROM permission_grants
+                   WHERE handler_id = ? AND permission_name = ?""",
+                (handler_id, permission_name),
+            ).fetchall()
         return [self._row_to_grant(r) for r in rows]
 
+    def get_active_grants(
+        self, handler_id: str, permission_name: str, now_iso: str
+    ) -> list[PermissionGrant]:
+        """Return grants that have not expired as of ``now_iso``.
+
+        Expired rows are left for the writer thread's periodic sweep.
+        """
+        with self._checkout_reader() as conn:
+            rows = conn.execute(
+                """SELECT * FROM permission_grants
+                   WHERE handler_id = ? AND permission_name = ?
+                     AND (expires_at IS NULL OR expires_at > ?)""",
+                (handler_id, permission_name, now_iso),
+            ).fetchall()
+        return [self._row_to_grant(r) for r in rows]
+
+    def delete_expired_grants(self, now_iso: str) -> None:
+        self._write(_DELETE_EXPIRED_GRANTS_SQL, (now_iso,))
+
     def get_all_grants(self) -> list[PermissionGrant]:
-        rows = self._conn.execute("SELECT * FROM permission_grants").fetchall()
+        with self._checkout_reader() as conn:
+            rows = conn.execute("SELECT * FROM permission_grants").fetchall()
         return [self._row_to_grant(r) for r in rows]
 
     def delete_grant(self, grant_id: str) -> None:
-        self._conn.execute(
-            "DELETE FROM permission_grants WHERE id = ?", (grant_id,)
-        )
-        self._conn.commit()
+        self._write("DELETE FROM permission_grants WHERE id = ?", (_encode_id(grant_id),))
 
     def _row_to_grant(self, row: sqlite3.Row) -> PermissionGrant:
         return PermissionGrant(
-            id=row["id"],
+            id=_decode_id(row["id"]),
             permission_name=row["permission_name"],
             handler_id=row["handler_id"],
-            scope=json.loads(row["scope"]),
-            expiration=Expiration(row["expiration"]),
+            scope=_loads_object(row["scope"]),
+            expiration=_EXPIRATION_BY_VALUE[row["expiration"]],
             expires_at=_str_to_dt(row["expires_at"]),
             granted_at=_str_to_dt(row["granted_at"]),  # type: ignore[arg-type]
             granted_by=row["granted_by"],
@@ -127,59 +517,146 @@ class Store:
     # ── Action Requests ──
 
     def save_action(self, action: ActionRequest) -> None:
-        self._conn.execute(
-            """INSERT OR REPLACE INTO action_requests
-               (id, handler_id, action_name, params, permission_name, permission_scope,
-                status, result, error, created_at, completed_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        self.save_action_async(action).result()
+
+    def save_action_async(self, action: ActionRequest) -> Future:
+        """Queue an action write; the returned future resolves once committed."""
+        return self._write_async(
+            _SAVE_ACTION_SQL,
             (
-                action.id,
+                _encode_id(action.id),
                 action.handler_id,
                 action.action_name,
-                json.dumps(action.params),
+                _dumps(action.params),
                 action.permission_name,
-                json.dumps(action.permission_scope),
+                _dumps(action.permission_scope),
                 action.status.value,
-                json.dumps(action.result) if action.result is not None else None,
+                _dumps(action.result) if action.result is not None else None,
                 action.error,
                 _dt_to_str(action.created_at),
                 _dt_to_str(action.completed_at),
             ),
         )
-        self._conn.commit()
+
+    def update_action_status(
+        self,
+        action_id: str,
+        status: ActionStatus,
+        result: Any = None,
+        error: str | None = None,
+        completed_at: datetime | None = None,
+    ) -> None:
+        """Update only the mutable status columns of an existing action."""
+        self._write(
+            _UPDATE_ACTION_STATUS_SQL,
+            (
+                status.value,
+                _dumps(result) if result is not None else None,
+                error,
+                _dt_to_str(completed_at),
+                _encode_id(action_id),
+            ),
+        )
+
+    def claim_pending(self, action_id: str) -> bool:
+        """Move a pending action to APPROVED.
+
+        Returns False if it was no longer pending, so of several concurrent
+        callers (threads or processes) exactly one wins the claim.
+        """
+        with self.transaction():
+            cursor = self._writer.execute(_CLAIM_PENDING_SQL, (_encode_id(action_id),))
+            return cursor.rowcount == 1
 
     def get_action(self, action_id: str) -> ActionRequest | None:
-        row = self._conn.execute(
-            "SELECT * FROM action_requests WHERE id = ?", (action_id,)
-        ).fetchone()
+        # Reads inside our own transaction may see uncommitted writes that
+        # have not bumped the version yet, so they skip the cache.
+        use_cache = self._txn_owner != threading.get_ident()
+        if use_cache:
+            version = self.version
+            with self._action_cache_lock:
+                cached = self._action_cache.get(action_id)
+                if cached is not None and cached[0] == version:
+                    self._action_cache.move_to_end(action_id)
+                    # Rows are immutable; callers get a fresh ActionRequest.
+                    return self._row_to_action(cached[1])
+        with self._checkout_reader() as conn:
+            row = conn.execute(
+                "SELECT * FROM action_requests WHERE id = ?",
+                (_encode_id(action_id),),
+            ).fetchone()
         if row is None:
             return None
+        if use_cache:
+            with self._action_cache_lock:
+                self._action_cache[action_id] = (version, row)
+                self._action_cache.move_to_end(action_id)
+                if len(self._action_cache) > _ACTION_CACHE_SIZE:
+                    self._action_cache.popitem(last=False)
         return self._row_to_action(row)
 
     def get_pending_actions(self) -> list[ActionRequest]:
-        rows = self._conn.execute(
-            "SELECT * FROM action_requests WHERE status = 'pending' ORDER BY created_at"
-        ).fetchall()
+        with self._checkout_reader() as conn:
+            rows = conn.execute(
+                "SELECT * FROM action_requests WHERE status = 'pending' ORDER BY created_at"
+            ).fetchall()
+        return [self._row_to_action(r) for r in rows]
+
+    def get_pending_for(
+        self, handler_id: str, permission_name: str
+    ) -> list[ActionRequest]:
+        """Return pending actions waiting on one handler permission."""
+        with self._checkout_reader() as conn:
+            rows = conn.execute(
+                """SELECT * FROM action_requests
+                   WHERE status = 'pending' AND handler_id = ? AND permission_name = ?
+                   ORDER BY created_at""",
+                (handler_id, permission_name),
+            ).fetchall()
         return [self._row_to_action(r) for r in rows]
 
+    def find_actions_covered_by(self, grant: PermissionGrant) -> list[str]:
+        """Return ids of pending actions whose scope ``grant`` covers.
+
+        Only the id and scope columns are read; scopes are matched against
+        the grant in Python without going back through permission checks.
+        """
+        with self._checkout_reader() as conn:
+            rows = conn.execute(
+                """SELECT id, permission_scope FROM action_requests
+                   WHERE status = 'pending' AND handler_id = ? AND permission_name = ?
+                   ORDER BY created_at""",
+                (grant.handler_id, grant.permission_name),
+            ).fetchall()
+        return [
+            _decode_id(r["id"]) for r in rows if grant.covers(_loads_object(r["permission_scope"]))
+        ]
+
     def get_actions_by_status(self, status: ActionStatus) -> list[ActionRequest]:
-        rows = self._conn.execute(
-            "SELECT * FROM action_requests WHERE status = ? ORDER BY created_at",
-            (status.value,),
-        ).fetchall()
+        with self._checkout_reader() as conn:
+            rows = conn.execute(
+                "SELECT * FROM action_requests WHERE status = ? ORDER BY created_at",
+                (status.value,),
+            ).fetchall()
+        return [self._row_to_action(r) for r in rows]
+
+    def get_recent_actions(self, limit: int = 50) -> list[ActionRequest]:
+        """Return the newest ``limit`` actions in any status, newest first."""
+        with self._checkout_reader() as conn:
+            rows = conn.execute(_RECENT_ACTIONS_SQL, (limit,)).fetchall()
         return [self._row_to_action(r) for r in rows]
 
     def _row_to_action(self, row: sqlite3.Row) -> ActionRequest:
         result_raw = row["result"]
-        result = json.loads(result_raw) if result_raw is not None else None
+        result = _loads(result_raw) if result_raw is not None else None
         return ActionRequest(
-            id=row["id"],
+            id=_decode_id(row["id"]),
             handler_id=row["handler_id"],
             action_name=row["action_name"],
-            params=json.loads(row["params"]),
+            params=_loads_object(row["params"]),
             permission_name=row["permission_name"],
-            permission_scope=json.loads(row["permission_scope"]),
-            status=ActionStatus(row["status"]),
+            permission_scope=_loads_object(row["permission_scope"]),
+            status=_STATUS_BY_VALUE[row["status"]],
             result=result,
             error=row["error"],
             created_at=_str_to_dt(row["created_at"]),  # type: ignore[arg-type]
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import pytest
@@ -17,6 +21,7 @@ from action_system import (
     Expiration,
     PermissionDef,
 )
+from action_system.store import _RECENT_ACTIONS_SQL, Store
 
 
 class DummyHandler(ActionHandler):
@@ -37,6 +42,55 @@ class DummyHandler(ActionHandler):
         return {"done": True, "action": action_name}
 
 
+class MappedHandler(ActionHandler):
+    handler_id = "mapped"
+    name = "Mapped"
+    permissions = [
+        PermissionDef(name="read", description="Read"),
+        PermissionDef(name="write", description="Write", parameters={"path": "Path"}),
+    ]
+    permission_map = {
+        "write": lambda params: ("write", {"path": params.get("path", "")}),
+    }
+
+    def execute(self, action_name: str, params: dict[str, Any]) -> Any:
+        return action_name
+
+
+@dataclass(slots=True)
+class TypedParams:
+    target: str = ""
+
+
+class TypedHandler(DummyHandler):
+    handler_id = "typed"
+    params_schema = TypedParams
+
+    def execute(self, action_name: str, params: Any) -> Any:
+        assert isinstance(params, TypedParams)
+        return {"target": params.target}
+
+
+class FastHandler(DummyHandler):
+    handler_id = "fast"
+    is_fast = True
+
+
+class SlowHandler(DummyHandler):
+    handler_id = "slow"
+
+    def __init__(self) -> None:
+        self.seen: list[ActionStatus] = []
+        self.system: ActionSystem | None = None
+
+    def execute(self, action_name: str, params: dict[str, Any]) -> Any:
+        # The RUNNING row is committed before execute() is called
+        assert self.system is not None
+        pending = self.system._store.get_actions_by_status(ActionStatus.RUNNING)
+        self.seen.extend(a.status for a in pending)
+        return super().execute(action_name, params)
+
+
 class TestActionSystem:
     def setup_method(self) -> None:
         self.system = ActionSystem()
@@ -106,6 +160,64 @@ class TestActionSystem:
         self.system.approve_action(pending[0].id)
         assert "completed" in events
 
+    def test_async_events_fire_off_thread(self) -> None:
+        system = ActionSystem(async_events=True)
+        system.register_handler(DummyHandler())
+        threads: list[threading.Thread] = []
+        system.events.on(ACTION_ENQUEUED, lambda **kw: threads.append(threading.current_thread()))
+        system.request_action("dummy", "run", {"target": "x"})
+        system.close()
+        assert len(threads) == 1
+        assert threads[0] is not threading.current_thread()
+
+    def test_concurrent_approve_executes_once(self) -> None:
+        calls: list[str] = []
+
+        class CountingHandler(DummyHandler):
+            handler_id = "counting"
+
+            def execute(self, action_name: str, params: dict[str, Any]) -> Any:
+                calls.append(action_name)
+                return super().execute(action_name, params)
+
+        self.system.register_handler(CountingHandler())
+        result = self.system.request_action("counting", "run", {"target": "x"})
+        self.system.grant_permission("counting", "do_thing", {"target": "x"})
+        barrier = threading.Barrier(4)
+        results: list[ActionResult] = []
+
+        def approve() -> None:
+            barrier.wait()
+            results.append(self.system.approve_action(result.action_id))
+
+        threads = [threading.Thread(target=approve) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert calls == ["run"]
+        assert len(results) == 4
+        assert self.system.get_action_status(result.action_id).status == ActionStatus.COMPLETED
+
+    def test_get_permission_def(self) -> None:
+        perm = self.system.get_permission_def("dummy", "do_thing")
+        assert perm is not None and perm.handler_id == "dummy"
+        assert self.system.get_permission_def("dummy", "missing") is None
+        assert self.system.get_permission_def("missing", "do_thing") is None
+
+    def test_get_pending_for(self) -> None:
+        self.system.register_handler(MappedHandler())
+        a = self.system.request_action("dummy", "run", {"target": "x"})
+        self.system.request_action("mapped", "write", {"path": "/a"})
+        pending = self.system.get_pending_for("dummy", "do_thing")
+        assert [p.id for p in pending] == [a.action_id]
+
+    def test_find_actions_covered_by(self) -> None:
+        a = self.system.request_action("dummy", "run", {"target": "x"})
+        self.system.request_action("dummy", "run", {"target": "y"})
+        grant = self.system.grant_permission("dummy", "do_thing", {"target": "x"})
+        assert self.system._store.find_actions_covered_by(grant) == [a.action_id]
+
     def test_get_action_status(self) -> None:
         result = self.system.request_action("dummy", "run", {"target": "x"})
         action = self.system.get_action_status(result.action_id)
@@ -117,6 +229,63 @@ class TestActionSystem:
         self.system.revoke_permission(grant.id)
         assert not self.system.check_permission("dummy", "do_thing", {"target": "x"})
 
+    def test_permission_check_is_cached(self) -> None:
+        self.system.grant_permission("dummy", "do_thing", {"target": "x"})
+        assert self.system.check_permission("dummy", "do_thing", {"target": "x"})
+        calls: list[tuple[str, str]] = []
+        original = self.system._store.get_active_grants
+
+        def tracking_get_grants(handler_id: str, permission_name: str, now_iso: str):
+            calls.append((handler_id, permission_name))
+            return original(handler_id, permission_name, now_iso)
+
+        self.system._store.get_active_grants = tracking_get_grants
+        assert self.system.check_permission("dummy", "do_thing", {"target": "x"})
+        assert calls == []
+
+    def test_permission_map_dispatch(self) -> None:
+        self.system.register_handler(MappedHandler())
+        self.system.grant_permission("mapped", "write", {"path": "/tmp/a"})
+        assert self.system.request_action("mapped", "write", {"path": "/tmp/a"}).is_completed
+        pending = self.system.request_action("mapped", "write", {"path": "/tmp/b"})
+        assert self.system.get_action_status(pending.action_id).permission_scope == {"path": "/tmp/b"}
+        # Unmapped actions fall back to the first permission, unscoped
+        other = self.system.request_action("mapped", "list", {})
+        assert self.system.get_action_status(other.action_id).permission_name == "read"
+
+    def test_params_schema_cast(self) -> None:
+        self.system.register_handler(TypedHandler())
+        self.system.grant_permission("typed", "do_thing", {})
+        result = self.system.request_action("typed", "run", {"target": "x", "extra": 1})
+        assert result.result == {"target": "x"}
+        action = self.system.get_action_status(result.action_id)
+        assert action.params == {"target": "x", "extra": 1}
+
+    def test_fast_handler_writes_once(self) -> None:
+        self.system.register_handler(FastHandler())
+        self.system.grant_permission("fast", "do_thing", {})
+        calls: list[ActionStatus] = []
+        original = self.system._store.save_action
+
+        def tracking_save(action: ActionRequest) -> None:
+            calls.append(action.status)
+            original(action)
+
+        self.system._store.save_action = tracking_save
+        result = self.system.request_action("fast", "run", {"target": "x"})
+        assert result.is_completed
+        assert calls == [ActionStatus.COMPLETED]
+
+    def test_slow_handler_persists_running(self) -> None:
+        handler = SlowHandler()
+        handler.system = self.system
+        self.system.register_handler(handler)
+        self.system.grant_permission("slow", "do_thing", {})
+        result = self.system.request_action("slow", "run", {"target": "x"})
+        assert result.is_completed
+        assert handler.seen == [ActionStatus.RUNNING]
+        assert self.system.get_action_status(result.action_id).status == ActionStatus.COMPLETED
+
     def test_tool_schemas(self) -> None:
         schemas = self.system.get_tool_schemas()
         assert len(schemas) == 1
@@ -156,6 +325,16 @@ class TestActionSystem:
         result = self.system.request_action("dummy", "run", {"target": "x"})
         assert result.is_completed
 
+    def test_check_matches_grant_covers_for_none_and_unhashable(self) -> None:
+        """check() agrees with PermissionGrant.covers() on edge-case scopes."""
+        none_grant = self.system.grant_permission("dummy", "do_thing", {"cc": None})
+        list_grant = self.system.grant_permission("mapped", "write", {"to": ["a"]})
+        assert none_grant.covers({"target": "x"})
+        assert self.system.check_permission("dummy", "do_thing", {"target": "x"})
+        assert list_grant.covers({"to": ["a"]})
+        assert self.system.check_permission("mapped", "write", {"to": ["a"]})
+        assert not self.system.check_permission("mapped", "write", {"to": ["b"]})
+
     def test_handler_render_request(self) -> None:
         result = self.system.request_action("dummy", "run", {"target": "x"})
         action = self.system.get_action_status(result.action_id)
@@ -187,8 +366,218 @@ class TestExpiration:
         assert grant.expires_at is not None
         assert not grant.is_expired()
 
+    def test_expired_grant_not_active(self) -> None:
+        grant = self.system.grant_permission(
+            "dummy", "do_thing", {}, Expiration.ONE_HOUR
+        )
+        store = self.system._store
+        later = (grant.expires_at + timedelta(seconds=1)).isoformat()
+        assert store.get_active_grants("dummy", "do_thing", later) == []
+        store.delete_expired_grants(later)
+        assert store.get_all_grants() == []
+
     def test_get_all_grants(self) -> None:
         self.system.grant_permission("dummy", "do_thing", {"target": "a"})
         self.system.grant_permission("dummy", "do_thing", {"target": "b"})
         grants = self.system.get_all_grants()
         assert len(grants) == 2
+
+
+def test_handler_without_execute_rejected() -> None:
+    class Incomplete(ActionHandler):
+        handler_id = "incomplete"
+        name = "Incomplete"
+        permissions = []
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_intermediate_base_without_execute_allowed() -> None:
+    class SharedBase(ActionHandler):
+        def helper(self) -> str:
+            return "shared"
+
+    class Concrete(SharedBase):
+        handler_id = "concrete"
+        name = "Concrete"
+        permissions = []
+
+        def execute(self, action_name: str, params: Any) -> Any:
+            return self.helper()
+
+    assert Concrete().execute("x", {}) == "shared"
+
+
+class TestStoreTransaction:
+    def setup_method(self) -> None:
+        self.system = ActionSystem()
+
+    def teardown_method(self) -> None:
+        self.system.close()
+
+    def test_transaction_commits(self) -> None:
+        store = self.system._store
+        with store.transaction():
+            store.save_action(ActionRequest(id="a1", handler_id="dummy", action_name="run"))
+        assert store.get_action("a1") is not None
+
+    def test_version_bumps_on_commit(self) -> None:
+        store = self.system._store
+        before = store.version
+        with store.transaction():
+            store.save_action(ActionRequest(id="a1", handler_id="dummy", action_name="run"))
+            assert store.version == before
+        assert store.version == before + 1
+        store.update_action_status("a1", ActionStatus.COMPLETED)
+        assert store.version == before + 2
+
+    def test_transaction_rolls_back_on_error(self) -> None:
+        store = self.system._store
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.save_action(ActionRequest(id="a1", handler_id="dummy", action_name="run"))
+                raise RuntimeError("boom")
+        assert store.get_action("a1") is None
+
+    def test_update_action_status(self) -> None:
+        store = self.system._store
+        store.save_action(ActionRequest(id="a1", handler_id="dummy", action_name="run"))
+        store.update_action_status("a1", ActionStatus.COMPLETED, result={"ok": True})
+        action = store.get_action("a1")
+        assert action is not None
+        assert action.status == ActionStatus.COMPLETED
+        assert action.result == {"ok": True}
+        assert action.action_name == "run"
+
+    def test_approve_actions_runs_handlers_outside_transaction(self) -> None:
+        store = self.system._store
+        owners: list[int | None] = []
+
+        class ProbeHandler(DummyHandler):
+            handler_id = "probe"
+            is_fast = True
+
+            def execute(self, action_name: str, params: dict[str, Any]) -> Any:
+                owners.append(store._txn_owner)
+                return super().execute(action_name, params)
+
+        self.system.register_handler(ProbeHandler())
+        ids = [
+            self.system.request_action("probe", "run", {"target": "x"}).action_id,
+            self.system.request_action("probe", "fail", {"target": "x"}).action_id,
+        ]
+        self.system.grant_permission("probe", "do_thing", {"target": "x"})
+        results = self.system.approve_actions(ids)
+        assert owners == [None, None]
+        assert [r.status for r in results] == [ActionStatus.COMPLETED, ActionStatus.FAILED]
+        assert [self.system.get_action_status(i).status for i in ids] == [
+            ActionStatus.COMPLETED,
+            ActionStatus.FAILED,
+        ]
+        # Already-approved actions are reported, not run again
+        assert [r.status for r in self.system.approve_actions(ids)] == [
+            ActionStatus.COMPLETED,
+            ActionStatus.FAILED,
+        ]
+        assert owners == [None, None]
+
+    def test_file_store_uses_wal(self, tmp_path) -> None:
+        system = ActionSystem(tmp_path / "actions.db")
+        try:
+            mode = system._store._writer.execute("PRAGMA journal_mode").fetchone()[0]
+            assert mode == "wal"
+        finally:
+            system.close()
+
+    def test_file_store_reads_through_pool(self, tmp_path) -> None:
+        system = ActionSystem(tmp_path / "actions.db")
+        system.register_handler(DummyHandler())
+        try:
+            result = system.request_action("dummy", "run", {"target": "x"})
+            assert [a.id for a in system.get_pending_actions()] == [result.action_id]
+            system.grant_permission("dummy", "do_thing", {"target": "x"})
+            assert system.approve_action(result.action_id).is_completed
+            with system._store._checkout_reader() as conn:
+                with pytest.raises(sqlite3.OperationalError):
+                    conn.execute("DELETE FROM action_requests")
+        finally:
+            system.close()
+
+    def test_save_action_async_batches(self) -> None:
+        store = self.system._store
+        futures = [
+            store.save_action_async(
+                ActionRequest(id=f"a{i}", handler_id="dummy", action_name="run")
+            )
+            for i in range(20)
+        ]
+        store.flush()
+        assert all(f.done() and f.exception() is None for f in futures)
+        assert len(store.get_pending_actions()) == 20
+
+    def test_get_recent_actions(self) -> None:
+        store = self.system._store
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for i in range(5):
+            store.save_action(ActionRequest(
+                id=f"r{i}", handler_id="dummy", action_name="run",
+                status=ActionStatus.COMPLETED if i % 2 else ActionStatus.PENDING,
+                created_at=base + timedelta(minutes=i),
+            ))
+        assert [a.id for a in store.get_recent_actions(3)] == ["r4", "r3", "r2"]
+
+    def test_get_action_cache_sees_updates(self) -> None:
+        store = self.system._store
+        store.save_action(ActionRequest(id="c1", handler_id="dummy", action_name="run"))
+        first = store.get_action("c1")
+        assert first is not None and first is not store.get_action("c1")
+        assert "c1" in store._action_cache
+        store.update_action_status("c1", ActionStatus.COMPLETED)
+        assert store.get_action("c1").status == ActionStatus.COMPLETED
+        with store.transaction():
+            store.update_action_status("c1", ActionStatus.FAILED, error="x")
+            assert store.get_action("c1").status == ActionStatus.FAILED
+
+    def test_version_sees_other_connections(self, tmp_path) -> None:
+        a = Store(tmp_path / "shared.db")
+        b = Store(tmp_path / "shared.db")
+        try:
+            b.save_action(ActionRequest(id="s1", handler_id="dummy", action_name="run"))
+            assert a.get_action("s1").status == ActionStatus.PENDING
+            before = a.version
+            b.update_action_status("s1", ActionStatus.COMPLETED)
+            assert a.version != before
+            assert a.get_action("s1").status == ActionStatus.COMPLETED
+        finally:
+            a.close()
+            b.close()
+
+    def test_permission_cache_sees_other_connections(self, tmp_path) -> None:
+        a = ActionSystem(tmp_path / "shared.db")
+        b = ActionSystem(tmp_path / "shared.db")
+        try:
+            assert not a.check_permission("dummy", "do_thing", {"target": "x"})
+            b.grant_permission("dummy", "do_thing", {"target": "x"})
+            assert a.check_permission("dummy", "do_thing", {"target": "x"})
+        finally:
+            a.close()
+            b.close()
+
+    def test_recent_actions_use_created_index(self) -> None:
+        plan = " ".join(
+            row[3] for row in self.system._store._writer.execute(
+                "EXPLAIN QUERY PLAN " + _RECENT_ACTIONS_SQL, (50,)
+            )
+        )
+        assert "idx_requests_created" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_generated_ids_stored_as_blobs(self) -> None:
+        store = self.system._store
+        action = ActionRequest(handler_id="dummy", action_name="run")
+        store.save_action(action)
+        stored = store._writer.execute("SELECT id FROM action_requests").fetchone()[0]
+        assert stored == bytes.fromhex(action.id)
+        loaded = store.get_action(action.id)
+        assert loaded is not None and loaded.id == action.id
@@ -1,4 +1,5 @@
-from .client import AgentClient
+from typing import TYPE_CHECKING
+
 from .events import AgentEvent, EventType
 from .exceptions import AgentError, AgentNotRunning, ProcessNotRunning
 from .tools import (
@@ -13,6 +14,19 @@ from .tools import (
     default_tools,
 )
 
+if TYPE_CHECKING:
+    from .client import AgentClient
+
+
+def __getattr__(name: str):
+    # AgentClient pulls in the OpenAI SDK; import it only when first used so
+    # `import agent.config` and friends stay cheap
+    if name == "AgentClient":
+        from .client import AgentClient
+
+        return AgentClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "AgentClient",
     "AgentEvent",
@@ -5,17 +5,27 @@
 # - Read: offset/limit with truncation
 
 import asyncio
-import difflib
+import itertools
+import os
 import re
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import httpx
-from pydantic import BaseModel, Field
+try:
+    # C implementation of difflib.SequenceMatcher, when installed
+    from cdifflib import CSequenceMatcher as _SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher as _SequenceMatcher
 
 
-class ToolResult(BaseModel):
+@dataclass(slots=True)
+class ToolResult:
     output: str
     is_error: bool = False
     # For edit tool - contains the diff and first changed line
@@ -23,10 +33,11 @@ class ToolResult(BaseModel):
     first_changed_line: int | None = None
 
 
-class ToolDefinition(BaseModel):
+@dataclass(slots=True)
+class ToolDefinition:
     name: str
     description: str
-    parameters: dict[str, Any] = Field(default_factory=dict)
+    parameters: dict[str, Any] = field(default_factory=dict)
 
     def to_openai_schema(self) -> dict[str, Any]:
         return {
@@ -50,19 +61,27 @@ class Tool(ABC):
 class ToolRegistry:
     def __init__(self) -> None:
         self._tools: dict[str, Tool] = {}
+        # Built at registration; schemas() is called on every LLM request
+        self._schemas: dict[str, dict[str, Any]] = {}
+        self._schema_list: list[dict[str, Any]] = []
 
     def register(self, tool: Tool) -> None:
         defn = tool.definition()
         self._tools[defn.name] = tool
+        self._schemas[defn.name] = defn.to_openai_schema()
+        self._schema_list = list(self._schemas.values())
 
     def get(self, name: str) -> Tool | None:
         return self._tools.get(name)
 
     def schemas(self) -> list[dict[str, Any]]:
-        return [t.definition().to_openai_schema() for t in self._tools.values()]
+        return self._schema_list
 
 
 _MAX_OUTPUT = 30_000
+# Bytes of command output kept before decoding; enough for _MAX_OUTPUT
+# characters of any UTF-8 text, plus one more so truncation is still seen.
+_MAX_OUTPUT_BYTES = 4 * (_MAX_OUTPUT + 1)
 _BASH_TIMEOUT = 120
 
 # Default truncation limits (matching pi-mono's truncate.ts)
@@ -79,13 +98,9 @@ def normalize_to_lf(text: str) -> str:
 
 def detect_line_ending(content: str) -> str:
     """Detect the line ending used in content."""
-    crlf_idx = content.find("\r\n")
+    # The first LF decides: CRLF if a CR comes right before it
     lf_idx = content.find("\n")
-    if lf_idx == -1:
-        return "\n"
-    if crlf_idx == -1:
-        return "\n"
-    return "\r\n" if crlf_idx < lf_idx else "\n"
+    return "\r\n" if lf_idx > 0 and content[lf_idx - 1] == "\r" else "\n"
 
 
 def restore_line_endings(text: str, ending: str) -> str:
@@ -95,6 +110,20 @@ def restore_line_endings(text: str, ending: str) -> str:
     return text
 
 
+_SMART_SINGLE_QUOTES = re.compile(r"[\u2018\u2019\u201A\u201B]")
+_SMART_DOUBLE_QUOTES = re.compile(r"[\u201C\u201D\u201E\u201F]")
+_DASHES = re.compile(r"[\u2010\u2011\u2012\u2013\u2014\u2015\u2212]")
+_SPECIAL_SPACES = re.compile(r"[\u00A0\u2002-\u200A\u202F\u205F\u3000]")
+# Anything normalize_for_fuzzy_match would change: trailing whitespace on a
+# line or any of the characters above
+_FUZZY_TARGETS = re.compile(
+    r"[^\S\n](?=\n|\Z)"
+    r"|[\u2018\u2019\u201A\u201B\u201C\u201D\u201E\u201F"
+    r"\u2010\u2011\u2012\u2013\u2014\u2015\u2212"
+    r"\u00A0\u2002-\u200A\u202F\u205F\u3000]"
+)
+
+
 def normalize_for_fuzzy_match(text: str) -> str:
     """
     Normalize text for fuzzy matching. Applies progressive transformations:
@@ -107,25 +136,29 @@ def normalize_for_fuzzy_match(text: str) -> str:
     # Strip trailing whitespace per line
     result = "\n".join(line.rstrip() for line in result.split("\n"))
     # Smart single quotes → '
-    result = re.sub(r"[\u2018\u2019\u201A\u201B]", "'", result)
+    result = _SMART_SINGLE_QUOTES.sub("'", result)
     # Smart double quotes → "
-    result = re.sub(r"[\u201C\u201D\u201E\u201F]", '"', result)
+    result = _SMART_DOUBLE_QUOTES.sub('"', result)
     # Various dashes/hyphens → -
-    result = re.sub(r"[\u2010\u2011\u2012\u2013\u2014\u2015\u2212]", "-", result)
+    result = _DASHES.sub("-", result)
     # Special spaces → regular space
-    result = re.sub(r"[\u00A0\u2002-\u200A\u202F\u205F\u3000]", " ", result)
+    result = _SPECIAL_SPACES.sub(" ", result)
     return result
 
 
-def fuzzy_find_text(content: str, old_text: str) -> tuple[bool, int, int, str]:
+def fuzzy_find_text(
+    content: str, old_text: str
+) -> tuple[bool, int, int, str, str | None, str | None]:
     """
     Find oldText in content, trying exact match first, then fuzzy match.
-    Returns: (found, index, match_length, content_for_replacement)
+    Returns: (found, index, match_length, content_for_replacement,
+    fuzzy_content, fuzzy_old_text). The last two are the normalized inputs
+    when the fuzzy pass ran, else None.
     """
     # Try exact match first
     exact_index = content.find(old_text)
     if exact_index != -1:
-        return (True, exact_index, len(old_text), content)
+        return (True, exact_index, len(old_text), content, None, None)
 
     # Try fuzzy match
     fuzzy_content = normalize_for_fuzzy_match(content)
@@ -133,9 +166,34 @@ def fuzzy_find_text(content: str, old_text: str) -> tuple[bool, int, int, str]:
     fuzzy_index = fuzzy_content.find(fuzzy_old_text)
 
     if fuzzy_index == -1:
-        return (False, -1, 0, content)
+        return (False, -1, 0, content, fuzzy_content, fuzzy_old_text)
+
+    return (True, fuzzy_index, len(fuzzy_old_text), fuzzy_content, fuzzy_content, fuzzy_old_text)
+
 
-    return (True, fuzzy_index, len(fuzzy_old_text), fuzzy_content)
+def _unified_range(start: int, stop: int) -> tuple[str, int]:
+    """Format a hunk range as difflib's unified_diff does.
+
+    Returns (range_text, first_line_number).
+    """
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return (f"{beginning}", beginning)
+    if not length:
+        beginning -= 1
+    return (f"{beginning},{length}", beginning)
+
+
+def _fuzzy_count(content: str, needle: str) -> int:
+    """
+    Count occurrences of needle in content after fuzzy normalization.
+    Text that normalization would leave untouched is counted as-is, without
+    building normalized copies.
+    """
+    if _FUZZY_TARGETS.search(needle) is None and _FUZZY_TARGETS.search(content) is None:
+        return content.count(needle)
+    return normalize_for_fuzzy_match(content).count(normalize_for_fuzzy_match(needle))
 
 
 def generate_diff_string(old_content: str, new_content: str, path: str = "", context_lines: int = 4) -> tuple[str, int | None]:
@@ -143,53 +201,59 @@ def generate_diff_string(old_content: str, new_content: str, path: str = "", con
     Generate a unified diff string with line numbers and context.
     Returns: (diff_string, first_changed_line)
     """
-    old_lines = old_content.split("\n")
-    new_lines = new_content.split("\n")
+    return generate_diff_lines(
+        old_content.split("\n"), new_content.split("\n"), path, context_lines
+    )
+
 
-    # Use Python's difflib
+def generate_diff_lines(old_lines: list[str], new_lines: list[str], path: str = "", context_lines: int = 4) -> tuple[str, int | None]:
+    """
+    Like generate_diff_string, for content already split on "\\n".
+    Returns: (diff_string, first_changed_line)
+    """
+    # Same hunks as difflib.unified_diff, built straight from the grouped
+    # opcodes so line numbers never need re-parsing from hunk headers.
     # Add file paths to diff header if path is provided
     fromfile = path if path else "original"
     tofile = path if path else "modified"
-    diff = difflib.unified_diff(
-        old_lines,
-        new_lines,
-        lineterm="",
-        n=context_lines,
-        fromfile=fromfile,
-        tofile=tofile,
-    )
+    matcher = _SequenceMatcher(None, old_lines, new_lines)
 
     output: list[str] = []
-    old_line_num = 1
-    new_line_num = 1
     first_changed_line: int | None = None
 
-    for line in diff:
-        if line.startswith("+++") or line.startswith("---") or line.startswith("@@"):
-            # Parse the hunk header to get line numbers
-            match = re.match(r"@@ -(\d+),?\d* \+(\d+),?\d* @@", line)
-            if match:
-                old_line_num = int(match.group(1))
-                new_line_num = int(match.group(2))
-            output.append(line)
-        elif line.startswith("+"):
-            if first_changed_line is None:
-                first_changed_line = new_line_num
-            output.append(f"{new_line_num:4d} {line}")
-            new_line_num += 1
-        elif line.startswith("-"):
+    for group in matcher.get_grouped_opcodes(context_lines):
+        if not output:
+            output.append(f"--- {fromfile}")
+            output.append(f"+++ {tofile}")
+        first, last = group[0], group[-1]
+        old_range, old_line_num = _unified_range(first[1], last[2])
+        new_range, new_line_num = _unified_range(first[3], last[4])
+        output.append(f"@@ -{old_range} +{new_range} @@")
+
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in old_lines[i1:i2]:
+                    output.append(f"{old_line_num:4d}  {line}")
+                    old_line_num += 1
+                    new_line_num += 1
+                continue
             if first_changed_line is None:
                 first_changed_line = new_line_num
-            output.append(f"{old_line_num:4d} {line}")
-            old_line_num += 1
-        else:
-            output.append(f"{old_line_num:4d} {line}")
-            old_line_num += 1
-            new_line_num += 1
+            if tag in ("replace", "delete"):
+                for line in old_lines[i1:i2]:
+                    output.append(f"{old_line_num:4d} -{line}")
+                    old_line_num += 1
+            if tag in ("replace", "insert"):
+                for line in new_lines[j1:j2]:
+                    output.append(f"{new_line_num:4d} +{line}")
+                    new_line_num += 1
 
     return ("\n".join(output), first_changed_line)
 
 
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
 def strip_bom(content: str) -> tuple[str, str]:
     """Strip UTF-8 BOM if present. Returns (bom, text_without_bom)."""
     if content.startswith("\ufeff"):
@@ -218,21 +282,59 @@ def truncate_head(
     Truncate content from the head (keep first N lines/bytes).
     Returns: (truncated_content, was_truncated, truncated_by_reason, total_lines, output_lines)
     """
-    total_bytes = len(content.encode("utf-8"))
-    lines = content.split("\n")
-    total_lines = len(lines)
+    (
+        output_bytes,
+        was_truncated,
+        truncated_by,
+        total_lines,
+        output_lines,
+    ) = truncate_head_bytes(content.encode("utf-8"), max_lines, max_bytes)
+    if not was_truncated:
+        return (content, False, None, total_lines, output_lines)
+    return (output_bytes.decode("utf-8"), True, truncated_by, total_lines, output_lines)
+
+
+def truncate_head_bytes(
+    buf: bytes,
+    max_lines: int = DEFAULT_MAX_LINES,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> tuple[bytes, bool, str | None, int, int]:
+    """
+    truncate_head for UTF-8 encoded content; lengths are measured directly
+    on the bytes. b"\\n" never occurs inside a multi-byte sequence, so
+    splitting the bytes splits the lines.
+    Returns: (truncated_content, was_truncated, truncated_by_reason, total_lines, output_lines)
+    """
+    lines = buf.split(b"\n")
+    if len(lines) <= max_lines and len(buf) <= max_bytes:
+        return (buf, False, None, len(lines), len(lines))
+    return truncate_head_lines(lines, max_lines, max_bytes)
+
 
-    # Check if no truncation needed
-    if total_lines <= max_lines and total_bytes <= max_bytes:
-        return (content, False, None, total_lines, total_lines)
+def truncate_head_lines(
+    lines: list[bytes],
+    max_lines: int = DEFAULT_MAX_LINES,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> tuple[bytes, bool, str | None, int, int]:
+    """
+    truncate_head_bytes for content already split on b"\\n", so callers
+    holding lines don't join them only to have them split again.
+    Returns: (truncated_content, was_truncated, truncated_by_reason, total_lines, output_lines)
+    """
+    total_lines = len(lines)
+    if total_lines <= max_lines:
+        # Lines plus the newlines between them
+        total_bytes = sum(map(len, lines)) + total_lines - 1
+        # Check if no truncation needed
+        if total_bytes <= max_bytes:
+            return (b"\n".join(lines), False, None, total_lines, total_lines)
 
     # Check if first line alone exceeds byte limit
-    first_line_bytes = len(lines[0].encode("utf-8"))
-    if first_line_bytes > max_bytes:
-        return ("", True, "first_line_exceeds_limit", total_lines, 0)
+    if len(lines[0]) > max_bytes:
+        return (b"", True, "first_line_exceeds_limit", total_lines, 0)
 
     # Collect complete lines that fit
-    output_lines: list[str] = []
+    output_line_count = 0
     output_bytes_count = 0
     truncated_by: str | None = None
 
@@ -241,42 +343,228 @@ def truncate_head(
             truncated_by = "lines"
             break
 
-        line_bytes = len(line.encode("utf-8")) + (1 if i > 0 else 0)  # +1 for newline
+        line_bytes = len(line) + (1 if i > 0 else 0)  # +1 for newline
 
         if output_bytes_count + line_bytes > max_bytes:
             truncated_by = "bytes"
             break
 
-        output_lines.append(line)
+        output_line_count += 1
         output_bytes_count += line_bytes
 
-    output_content = "\n".join(output_lines)
-    return (output_content, truncated_by is not None, truncated_by, total_lines, len(output_lines))
+    output_content = b"\n".join(lines[:output_line_count])
+    return (output_content, truncated_by is not None, truncated_by, total_lines, output_line_count)
+
+
+def _split_text_bytes(raw: bytes) -> list[bytes]:
+    """
+    Split UTF-8 file content into lines, dropping a leading BOM and treating
+    CRLF and lone CR as line breaks. Neither occurs inside a multi-byte
+    sequence, so this is safe before decoding.
+    """
+    if raw.startswith(_UTF8_BOM):
+        raw = raw[len(_UTF8_BOM):]
+    return raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n").split(b"\n")
+
+
+_FILE_CACHE_SIZE = 16
+_FILE_CACHE_MAX_BYTES = 4 * 1024 * 1024
+# Files modified more recently than this may change again without their
+# mtime moving (coarse filesystem timestamps), so they are not cached.
+_FILE_CACHE_MIN_AGE_NS = 2_000_000_000
+
+_FileStamp = tuple[int, int, int, int, int]
+
+# absolute path -> (stamp, split lines); lines are shared, never mutate them
+_file_cache: OrderedDict[str, tuple[_FileStamp, list[bytes]]] = OrderedDict()
+_file_cache_lock = threading.Lock()
+
+
+def _read_split_lines(path: Path) -> list[bytes]:
+    """
+    _split_text_bytes of a file's content. The split is kept for a few small
+    files and reused while their stat is unchanged, as a file is often read
+    several times in one session.
+    """
+    key = os.path.abspath(path)
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        stamp = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+        with _file_cache_lock:
+            cached = _file_cache.get(key)
+            if cached is not None and cached[0] == stamp:
+                _file_cache.move_to_end(key)
+                return cached[1]
+        lines = _split_text_bytes(f.read())
+    if (
+        st.st_size <= _FILE_CACHE_MAX_BYTES
+        and time.time_ns() - st.st_mtime_ns > _FILE_CACHE_MIN_AGE_NS
+    ):
+        with _file_cache_lock:
+            _file_cache[key] = (stamp, lines)
+            _file_cache.move_to_end(key)
+            if len(_file_cache) > _FILE_CACHE_SIZE:
+                _file_cache.popitem(last=False)
+    return lines
+
+
+def _forget_file(path: Path) -> None:
+    with _file_cache_lock:
+        _file_cache.pop(os.path.abspath(path), None)
+
+
+_COUNT_CHUNK_CHARS = 1 << 20
+
+
+def _read_line_window(path: Path, start: int, count: int) -> tuple[list[bytes], int]:
+    """
+    Read lines [start, start + count) of a file as _split_text_bytes would
+    split it, without holding the rest of the file in memory.
+    Returns: (window_lines, total_lines)
+    """
+    window: list[bytes] = []
+    seen = 0  # terminated or final non-empty lines iterated so far
+    last = ""
+    # Universal newlines and utf-8-sig give the same lines as
+    # _split_text_bytes; undecodable bytes are replaced as on output.
+    with path.open(encoding="utf-8-sig", errors="replace", newline=None) as f:
+        for last in itertools.islice(f, start):
+            seen += 1
+        for last in itertools.islice(f, count):
+            seen += 1
+            window.append(last.removesuffix("\n").encode("utf-8"))
+        # Past the window only the count matters, so count newlines in
+        # large chunks instead of materializing every remaining line.
+        ends_with_newline = last.endswith("\n")
+        tail_seen = False
+        while chunk := f.read(_COUNT_CHUNK_CHARS):
+            seen += chunk.count("\n")
+            ends_with_newline = chunk.endswith("\n")
+            tail_seen = True
+        if tail_seen and not ends_with_newline:
+            seen += 1
+    # Like str.split, an empty file or one ending in a newline has one more,
+    # empty, line after the last terminator.
+    total = seen
+    if seen == 0 or ends_with_newline:
+        total += 1
+        if start <= seen < start + count:
+            window.append(b"")
+    return (window, total)
+
+
+async def _read_capped(
+    stream: asyncio.StreamReader, cap: int, chunks: list[bytes]
+) -> None:
+    """Read a stream to EOF, appending only about its first cap bytes to chunks.
+
+    The caller owns chunks, so what was read survives a cancelled read.
+    """
+    kept = 0
+    while chunk := await stream.read(65536):
+        # Keep draining past the cap so the process never blocks on a full pipe
+        if kept < cap:
+            chunks.append(chunk)
+            kept += len(chunk)
+
+
+def _cap_output(chunks: list[bytes]) -> str:
+    output = b"".join(chunks).decode(errors="replace")
+    if len(output) > _MAX_OUTPUT:
+        output = output[:_MAX_OUTPUT] + "\n... (output truncated)"
+    return output
+
+
+def _write_fd(fd: int, data: bytes) -> None:
+    """os.write all of data, continuing after short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+# mkstemp creates files 0600; new files get the usual umask-derived mode.
+# Read once at import, since os.umask() can only be queried by setting it.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    Replace a file's content via a sibling temp file and os.replace, so
+    readers never see a partially written file. An existing file keeps its
+    permission bits, and a symlink is written through rather than replaced.
+    """
+    # Drop any cached split, under the given name and the real one
+    _forget_file(path)
+    path = Path(os.path.realpath(path))
+    _forget_file(path)
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = _NEW_FILE_MODE
+    # A unique name, so concurrent writes don't collide and an unrelated
+    # "<name>.tmp" next to the file is never touched
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        try:
+            os.fchmod(fd, mode)
+            _write_fd(fd, data)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+_SAME_CONTENT_MAX_BYTES = 1024 * 1024
+
+
+def _has_content(path: Path, data: bytes) -> bool:
+    """Whether path is a small existing file already holding exactly data."""
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            return size == len(data) <= _SAME_CONTENT_MAX_BYTES and f.read() == data
+    except OSError:
+        return False
+
+
+def _write_with_parents(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = content.encode("utf-8")
+    # Rewriting identical content would only churn the file's mtime
+    if not _has_content(path, data):
+        _atomic_write(path, data)
 
 
 # === Tool implementations ===
 
 class BashTool(Tool):
-    def definition(self) -> ToolDefinition:
-        return ToolDefinition(
-            name="bash",
-            description="Execute a bash command and return stdout+stderr.",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "command": {
-                        "type": "string",
-                        "description": "The bash command to execute.",
-                    },
+    _DEFINITION = ToolDefinition(
+        name="bash",
+        description="Execute a bash command and return stdout+stderr.",
+        parameters={
+            "type": "object",
+            "properties": {
+                "command": {
+                    "type": "string",
+                    "description": "The bash command to execute.",
                 },
-                "required": ["command"],
             },
-        )
+            "required": ["command"],
+        },
+    )
+
+    def definition(self) -> ToolDefinition:
+        return self._DEFINITION
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
         command = args.get("command", "")
         if not command:
             return ToolResult(output="No command provided.", is_error=True)
+        chunks: list[bytes] = []
         try:
             proc = await asyncio.create_subprocess_exec(
                 "bash",
@@ -285,50 +573,57 @@ class BashTool(Tool):
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.STDOUT,
             )
-            stdout, _ = await asyncio.wait_for(
-                proc.communicate(), timeout=_BASH_TIMEOUT
+            assert proc.stdout is not None
+            await asyncio.wait_for(
+                asyncio.gather(
+                    _read_capped(proc.stdout, _MAX_OUTPUT_BYTES, chunks), proc.wait()
+                ),
+                timeout=_BASH_TIMEOUT,
             )
-            output = stdout.decode(errors="replace")
-            if len(output) > _MAX_OUTPUT:
-                output = output[:_MAX_OUTPUT] + "\n... (output truncated)"
+            output = _cap_output(chunks)
             if proc.returncode != 0:
                 output = f"Exit code: {proc.returncode}\n{output}"
             return ToolResult(output=output, is_error=proc.returncode != 0)
         except asyncio.TimeoutError:
             proc.kill()
-            await proc.wait()
-            return ToolResult(
-                output=f"Command timed out after {_BASH_TIMEOUT}s.",
-                is_error=True,
-            )
+            # wait() only returns once the pipe is closed, so read (and drop)
+            # whatever is still buffered in it
+            await asyncio.gather(_read_capped(proc.stdout, 0, []), proc.wait())
+            # Report what the command printed before it was killed
+            output = f"Command timed out after {_BASH_TIMEOUT}s."
+            if chunks:
+                output = f"{output}\n{_cap_output(chunks)}"
+            return ToolResult(output=output, is_error=True)
         except OSError as e:
             return ToolResult(output=f"Failed to execute command: {e}", is_error=True)
 
 
 class ReadTool(Tool):
-    def definition(self) -> ToolDefinition:
-        return ToolDefinition(
-            name="read",
-            description=f"""Read the contents of a file. Output is truncated to {DEFAULT_MAX_LINES} lines or {format_size(DEFAULT_MAX_BYTES)} (whichever is hit first). Use offset/limit for large files.""",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the file to read (relative or absolute).",
-                    },
-                    "offset": {
-                        "type": "integer",
-                        "description": "Line number to start reading from (1-indexed).",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of lines to read.",
-                    },
+    _DEFINITION = ToolDefinition(
+        name="read",
+        description=f"""Read the contents of a file. Output is truncated to {DEFAULT_MAX_LINES} lines or {format_size(DEFAULT_MAX_BYTES)} (whichever is hit first). Use offset/limit for large files.""",
+        parameters={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the file to read (relative or absolute).",
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Line number to start reading from (1-indexed).",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of lines to read.",
                 },
-                "required": ["path"],
             },
-        )
+            "required": ["path"],
+        },
+    )
+
+    def definition(self) -> ToolDefinition:
+        return self._DEFINITION
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
         # Accept both camelCase (LLM convention) and snake_case (Python convention)
@@ -339,28 +634,28 @@ class ReadTool(Tool):
         if not path:
             return ToolResult(output="No path provided.", is_error=True)
 
+        # Apply offset (1-indexed to 0-indexed)
+        start_line = (offset - 1) if offset else 0
+        start_line = max(0, start_line)
+
         try:
             file_path = Path(path)
-            raw_content = file_path.read_text()
+            if limit is not None:
+                # A bounded window: stream just those lines instead of
+                # loading and splitting the whole file.
+                window, total_file_lines = await asyncio.to_thread(
+                    _read_line_window, file_path, start_line, max(0, limit)
+                )
+                all_lines = None
+            else:
+                # Work on the raw bytes and decode only what is returned.
+                all_lines = await asyncio.to_thread(_read_split_lines, file_path)
+                total_file_lines = len(all_lines)
         except FileNotFoundError:
             return ToolResult(output=f"File not found: {path}", is_error=True)
         except OSError as e:
             return ToolResult(output=f"Error reading file: {e}", is_error=True)
 
-        # Strip BOM before processing
-        _, content = strip_bom(raw_content)
-
-        # Normalize line endings
-        original_ending = detect_line_ending(content)
-        content = normalize_to_lf(content)
-
-        all_lines = content.split("\n")
-        total_file_lines = len(all_lines)
-
-        # Apply offset (1-indexed to 0-indexed)
-        start_line = (offset - 1) if offset else 0
-        start_line = max(0, start_line)
-
         # Check if offset is out of bounds
         if start_line >= total_file_lines:
             return ToolResult(
@@ -368,28 +663,29 @@ class ReadTool(Tool):
                 is_error=True,
             )
 
-        # Get the content to truncate
-        if limit is not None:
-            end_line = min(start_line + limit, total_file_lines)
-            selected_content = "\n".join(all_lines[start_line:end_line])
-            user_limited_lines = end_line - start_line
+        # Get the lines to truncate
+        if all_lines is None:
+            selected_lines = window or [b""]
+            user_limited_lines = len(window)
         else:
-            selected_content = "\n".join(all_lines[start_line:])
+            # Reading from the top needs no copy of the line list
+            selected_lines = all_lines[start_line:] if start_line else all_lines
             user_limited_lines = None
 
         # Apply truncation
         (
-            truncated_content,
+            truncated_bytes,
             was_truncated,
             truncated_reason,
             total_lines,
             output_lines,
-        ) = truncate_head(selected_content)
+        ) = truncate_head_lines(selected_lines)
+        truncated_content = truncated_bytes.decode("utf-8", errors="replace")
 
         start_line_display = start_line + 1  # For display (1-indexed)
 
         if was_truncated and truncated_reason == "first_line_exceeds_limit":
-            first_line_size = format_size(len(all_lines[start_line].encode("utf-8")))
+            first_line_size = format_size(len(selected_lines[0]))
             output = f"[Line {start_line_display} is {first_line_size}, exceeds {format_size(DEFAULT_MAX_BYTES)} limit. Use bash: sed -n '{start_line_display}p' {path} | head -c {DEFAULT_MAX_BYTES}]"
         elif was_truncated:
             end_line_display = start_line_display + output_lines - 1
@@ -414,25 +710,27 @@ class ReadTool(Tool):
 
 
 class WriteTool(Tool):
-    def definition(self) -> ToolDefinition:
-        return ToolDefinition(
-            name="write",
-            description="Write content to a file. Creates parent directories if needed.",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Absolute path to the file to write.",
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "Content to write to the file.",
-                    },
+    _DEFINITION = ToolDefinition(
+        name="write",
+        description="Write content to a file. Creates parent directories if needed.",
+        parameters={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Absolute path to the file to write.",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Content to write to the file.",
                 },
-                "required": ["file_path", "content"],
             },
-        )
+            "required": ["file_path", "content"],
+        },
+    )
+
+    def definition(self) -> ToolDefinition:
+        return self._DEFINITION
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
         file_path = args.get("file_path", "")
@@ -441,19 +739,16 @@ class WriteTool(Tool):
         if not file_path:
             return ToolResult(output="No file_path provided.", is_error=True)
         try:
-            path = Path(file_path)
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(content)
+            await asyncio.to_thread(_write_with_parents, Path(file_path), content)
             return ToolResult(output=f"Wrote {len(content)} bytes to {file_path}")
         except OSError as e:
             return ToolResult(output=f"Error writing file: {e}", is_error=True)
 
 
 class EditTool(Tool):
-    def definition(self) -> ToolDefinition:
-        return ToolDefinition(
-            name="edit",
-            description="""
+    _DEFINITION = ToolDefinition(
+        name="edit",
+        description="""
 Edit a file by replacing exact text. The oldText must match exactly (including whitespace). Uses fuzzy matching to handle minor differences in whitespace, quotes, and dashes.
 
 Parameters:
@@ -463,25 +758,28 @@ Parameters:
 
 The tool returns a diff of the changes made.
 """,
-            parameters={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the file to edit (relative or absolute).",
-                    },
-                    "oldText": {
-                        "type": "string",
-                        "description": "Exact text to find and replace (must match exactly).",
-                    },
-                    "newText": {
-                        "type": "string",
-                        "description": "New text to replace the old text with.",
-                    },
+        parameters={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the file to edit (relative or absolute).",
+                },
+                "oldText": {
+                    "type": "string",
+                    "description": "Exact text to find and replace (must match exactly).",
+                },
+                "newText": {
+                    "type": "string",
+                    "description": "New text to replace the old text with.",
                 },
-                "required": ["path", "oldText", "newText"],
             },
-        )
+            "required": ["path", "oldText", "newText"],
+        },
+    )
+
+    def definition(self) -> ToolDefinition:
+        return self._DEFINITION
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
         # Accept both camelCase (LLM convention) and snake_case (Python convention)
@@ -498,10 +796,12 @@ The tool returns a diff of the changes made.
 
         try:
             file_path = Path(path)
-            raw_content = file_path.read_text()
+            # Decode the bytes directly: no locale codec, and no newline
+            # translation hiding CRLF from detect_line_ending
+            raw_content = (await asyncio.to_thread(file_path.read_bytes)).decode("utf-8")
         except FileNotFoundError:
             return ToolResult(output=f"File not found: {path}", is_error=True)
-        except OSError as e:
+        except (OSError, UnicodeDecodeError) as e:
             return ToolResult(output=f"Error reading file: {e}", is_error=True)
 
         # Strip BOM before matching
@@ -514,9 +814,14 @@ The tool returns a diff of the changes made.
         normalized_new_text = normalize_to_lf(new_text)
 
         # Find the old text using fuzzy matching
-        found, match_index, match_length, content_for_replacement = fuzzy_find_text(
-            normalized_content, normalized_old_text
-        )
+        (
+            found,
+            match_index,
+            match_length,
+            content_for_replacement,
+            fuzzy_content,
+            fuzzy_old_text,
+        ) = fuzzy_find_text(normalized_content, normalized_old_text)
 
         if not found:
             return ToolResult(
@@ -524,10 +829,12 @@ The tool returns a diff of the changes made.
                 is_error=True,
             )
 
-        # Count occurrences using fuzzy-normalized content
-        fuzzy_content = normalize_for_fuzzy_match(normalized_content)
-        fuzzy_old_text = normalize_for_fuzzy_match(normalized_old_text)
-        occurrences = fuzzy_content.count(fuzzy_old_text)
+        # Count occurrences using fuzzy-normalized content, reusing the
+        # normalization from the fuzzy pass when it ran
+        if fuzzy_content is None or fuzzy_old_text is None:
+            occurrences = _fuzzy_count(normalized_content, normalized_old_text)
+        else:
+            occurrences = fuzzy_content.count(fuzzy_old_text)
 
         if occurrences > 1:
             return ToolResult(
@@ -536,14 +843,16 @@ The tool returns a diff of the changes made.
             )
 
         # Perform replacement
+        match_end = match_index + match_length
         new_content = (
             content_for_replacement[:match_index]
             + normalized_new_text
-            + content_for_replacement[match_index + match_length:]
+            + content_for_replacement[match_end:]
         )
 
-        # Verify the replacement actually changed something
-        if content_for_replacement == new_content:
+        # Verify the replacement actually changed something; only the
+        # matched span differs between the two, so compare just that
+        if content_for_replacement[match_index:match_end] == normalized_new_text:
             return ToolResult(
                 output=f"No changes made to {path}. The replacement produced identical content. This might indicate an issue with special characters or the text not existing as expected.",
                 is_error=True,
@@ -554,13 +863,29 @@ The tool returns a diff of the changes made.
         final_content = bom + final_content
 
         try:
-            file_path.write_text(final_content)
+            await asyncio.to_thread(
+                _atomic_write, file_path, final_content.encode("utf-8")
+            )
         except OSError as e:
             return ToolResult(output=f"Error writing file: {e}", is_error=True)
 
-        # Generate diff
-        diff_string, first_changed_line = generate_diff_string(
-            content_for_replacement, new_content, path=path
+        # Generate diff. The new lines are the old ones with the lines
+        # touching the match swapped out, so nothing is split twice.
+        old_lines = content_for_replacement.split("\n")
+        first_line = content_for_replacement.count("\n", 0, match_index)
+        last_line = first_line + content_for_replacement.count("\n", match_index, match_end)
+        line_start = content_for_replacement.rfind("\n", 0, match_index) + 1
+        line_end = content_for_replacement.find("\n", match_end)
+        if line_end == -1:
+            line_end = len(content_for_replacement)
+        replaced = (
+            content_for_replacement[line_start:match_index]
+            + normalized_new_text
+            + content_for_replacement[match_end:line_end]
+        )
+        new_lines = old_lines[:first_line] + replaced.split("\n") + old_lines[last_line + 1:]
+        diff_string, first_changed_line = generate_diff_lines(
+            old_lines, new_lines, path=path
         )
 
         return ToolResult(
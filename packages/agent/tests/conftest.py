@@ -0,0 +1,34 @@
+"""Shared pytest configuration for the agent tests."""
+import os
+import shutil
+import tempfile
+
+import pytest
+
+_SHM = "/dev/shm"
+_shm_basetemp: str | None = None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # The tool tests make many small file writes; keep tmp_path on tmpfs when
+    # available, unless --basetemp or TMPDIR says otherwise. Only pytest's
+    # own temp root moves: tempfile in the code under test is left alone.
+    # Runs before the tmp_path plugin reads the option.
+    global _shm_basetemp
+    if (
+        config.option.basetemp is None
+        and "TMPDIR" not in os.environ
+        and os.path.isdir(_SHM)
+        and os.access(_SHM, os.W_OK)
+    ):
+        _shm_basetemp = tempfile.mkdtemp(prefix="pytest-agent-", dir=_SHM)
+        config.option.basetemp = _shm_basetemp
+
+
+def pytest_unconfigure(config):
+    # tmpfs is memory; don't leave test trees behind in it
+    global _shm_basetemp
+    if _shm_basetemp is not None:
+        shutil.rmtree(_shm_basetemp, ignore_errors=True)
+        _shm_basetemp = None
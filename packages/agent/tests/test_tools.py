@@ -1,22 +1,33 @@
 """Tests for the ReadTool and EditTool (pi-mono style)."""
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
 
-from agent.tools import EditTool, ReadTool, ToolResult
+from agent import tools
+from agent.tools import (
+    _MAX_OUTPUT,
+    BashTool,
+    EditTool,
+    ReadTool,
+    ToolResult,
+    WriteTool,
+    _read_split_lines,
+    default_tools,
+    truncate_head,
+)
 
 
 @pytest.fixture
-def temp_file():
+def temp_file(tmp_path):
     """Fixture to provide a temp file with test content."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write("""# Test file
+    path = tmp_path / "sample.py"
+    path.write_text("""# Test file
 def hello():
     print("Hello, world!")
     return True
 """)
-        return f.name
+    return str(path)
 
 
 @pytest.mark.asyncio
@@ -159,3 +170,164 @@ async def test_edit_tool_diff_includes_path(temp_file):
     assert "+++" in result.diff
     # The path should appear in both header lines
     assert temp_file in result.diff
+
+
+def test_truncate_head_counts_utf8_bytes():
+    """truncate_head keeps whole lines within the UTF-8 byte budget."""
+    content = "héllo\nwörld\nthird"
+    # "héllo" is 6 bytes, "\nwörld" is 7: 13 fits, the third line doesn't
+    result = truncate_head(content, max_bytes=14)
+    assert result == ("héllo\nwörld", True, "bytes", 3, 2)
+    assert truncate_head(content, max_lines=1) == ("héllo", True, "lines", 3, 1)
+    assert truncate_head(content) == (content, False, None, 3, 3)
+
+
+@pytest.mark.asyncio
+async def test_read_tool_bom_crlf_and_invalid_utf8(tmp_path):
+    """ReadTool strips the BOM, normalizes CRLF and replaces undecodable bytes."""
+    path = tmp_path / "data.txt"
+    path.write_bytes(b"\xef\xbb\xbfone\r\ntwo \xff\r\n")
+    result = await ReadTool().execute({"path": str(path)})
+
+    assert not result.is_error
+    assert result.output == "one\ntwo �\n"
+
+
+@pytest.mark.asyncio
+async def test_read_tool_window_counts_remaining_lines(tmp_path):
+    """Windowed reads report the same line totals as a full read."""
+    path = tmp_path / "lines.txt"
+    path.write_text("".join(f"line {i}\r\n" for i in range(1, 101)), newline="")
+    result = await ReadTool().execute({"path": str(path), "offset": 10, "limit": 2})
+
+    assert not result.is_error
+    assert result.output == "line 10\nline 11\n\n[90 more lines in file. Use offset=12 to continue.]"
+
+
+def test_registry_schemas_cached_per_registration():
+    """schemas() returns the list built at registration time."""
+    registry = default_tools()
+    schemas = registry.schemas()
+
+    assert [s["function"]["name"] for s in schemas] == ["bash", "read", "write", "edit"]
+    assert registry.schemas() is schemas
+    registry.register(ReadTool())
+    assert len(registry.schemas()) == 4
+
+
+@pytest.mark.asyncio
+async def test_edit_tool_keeps_mode_and_symlink(tmp_path):
+    """EditTool replaces the file atomically, through symlinks, keeping its mode."""
+    target = tmp_path / "run.sh"
+    target.write_text("echo one\n")
+    target.chmod(0o755)
+    link = tmp_path / "link.sh"
+    link.symlink_to(target)
+
+    result = await EditTool().execute({"path": str(link), "oldText": "one", "newText": "two"})
+
+    assert not result.is_error, result.output
+    assert link.is_symlink()
+    assert target.read_text() == "echo two\n"
+    assert target.stat().st_mode & 0o777 == 0o755
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["link.sh", "run.sh"]
+
+
+@pytest.mark.asyncio
+async def test_write_tool_leaves_sibling_tmp_file_alone(tmp_path):
+    """The temp file is uniquely named; an existing "<name>.tmp" survives."""
+    target = tmp_path / "notes"
+    stray = tmp_path / "notes.tmp"
+    stray.write_text("keep me\n")
+
+    result = await WriteTool().execute({"file_path": str(target), "content": "new\n"})
+
+    assert not result.is_error, result.output
+    assert target.read_text() == "new\n"
+    assert stray.read_text() == "keep me\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["notes", "notes.tmp"]
+    umask = os.umask(0)
+    os.umask(umask)
+    assert target.stat().st_mode & 0o777 == 0o666 & ~umask
+
+
+@pytest.mark.asyncio
+async def test_read_tool_reuses_split_until_file_changes(tmp_path):
+    """Unchanged, settled files reuse their cached split; edits are seen."""
+    target = tmp_path / "settled.txt"
+    target.write_text("alpha\nbeta\n")
+    os.utime(target, ns=(0, 0))
+
+    assert _read_split_lines(target) is _read_split_lines(target)
+
+    await EditTool().execute({"path": str(target), "oldText": "beta", "newText": "gamma"})
+    result = await ReadTool().execute({"path": str(target)})
+    assert result.output == "alpha\ngamma\n"
+
+
+@pytest.mark.asyncio
+async def test_write_tool_skips_identical_content(tmp_path):
+    """Writing the content a file already has leaves the file untouched."""
+    target = tmp_path / "same.txt"
+    target.write_text("unchanged\n")
+    os.utime(target, ns=(0, 0))
+
+    result = await WriteTool().execute({"file_path": str(target), "content": "unchanged\n"})
+    assert not result.is_error
+    assert target.stat().st_mtime_ns == 0
+
+    await WriteTool().execute({"file_path": str(target), "content": "changed\n"})
+    assert target.read_text() == "changed\n"
+
+
+@pytest.mark.asyncio
+async def test_edit_tool_preserves_crlf(tmp_path):
+    """EditTool keeps CRLF line endings and the BOM of the file it edits."""
+    target = tmp_path / "dos.txt"
+    target.write_bytes(b"\xef\xbb\xbfone\r\ntwo\r\n")
+
+    result = await EditTool().execute({"path": str(target), "oldText": "two", "newText": "three"})
+
+    assert not result.is_error, result.output
+    assert target.read_bytes() == b"\xef\xbb\xbfone\r\nthree\r\n"
+
+
+@pytest.mark.asyncio
+async def test_bash_tool_passes_small_output_through():
+    result = await BashTool().execute({"command": "printf 'one\\ntwo\\n'"})
+
+    assert not result.is_error
+    assert result.output == "one\ntwo\n"
+
+
+@pytest.mark.asyncio
+async def test_bash_tool_caps_large_output_and_keeps_exit_code():
+    """Output far beyond a pipe buffer is drained, capped and marked."""
+    command = "head -c 5000000 /dev/zero | tr '\\0' a; exit 3"
+    result = await BashTool().execute({"command": command})
+
+    assert result.is_error
+    assert result.output.startswith("Exit code: 3\naaaa")
+    assert result.output.endswith("a\n... (output truncated)")
+    prefix, marker = "Exit code: 3\n", "\n... (output truncated)"
+    assert len(result.output) == len(prefix) + _MAX_OUTPUT + len(marker)
+
+
+@pytest.mark.asyncio
+async def test_bash_tool_timeout_keeps_captured_output(monkeypatch):
+    """A runaway producer is killed at the timeout; its capped prefix is kept."""
+    monkeypatch.setattr(tools, "_BASH_TIMEOUT", 1)
+    result = await BashTool().execute({"command": "yes"})
+
+    assert result.is_error
+    assert result.output.startswith("Command timed out after 1s.\ny\ny\n")
+    assert result.output.endswith("\n... (output truncated)")
+
+
+@pytest.mark.asyncio
+async def test_bash_tool_timeout_keeps_short_output(monkeypatch):
+    monkeypatch.setattr(tools, "_BASH_TIMEOUT", 1)
+    result = await BashTool().execute({"command": "echo started; exec sleep 5"})
+
+    assert result.is_error
+    assert result.output == "Command timed out after 1s.\nstarted\n"
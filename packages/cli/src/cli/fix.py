@@ -14,7 +14,6 @@ from typing import Annotated, Optional
 import typer
 
 from agent.config import get_api_key as _get_api_key_from_config
-from agent.client import AgentClient
 from agent.events import EventType
 
 from .paths import DefaultPaths
@@ -280,6 +279,7 @@ async def _run_fix_mode(
     issue_id: Optional[int] = None,
 ) -> None:
     """Run fix mode - iterate through local issues and fix them."""
+    from agent.client import AgentClient
 
     print(f"Database: {db_path}")
 
@@ -2,25 +2,69 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import random
+import sys
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated, Any, Optional
 
 import typer
 
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
 from agent.config import get_api_key as _get_api_key_from_config, save_user_config, load_user_config
 
-from . import daemon, tui, fix
 from .paths import DefaultPaths
 
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 8765
 DEFAULT_LOG_LEVEL = "info"
 
+# Options shared by the default command and the gateway start/restart commands
+HostOption = Annotated[str, typer.Option("--host", help="Bind address")]
+PortOption = Annotated[int, typer.Option("--port", help="Port")]
+TlsCertOption = Annotated[str | None, typer.Option("--tls-cert", help="TLS certificate file")]
+TlsKeyOption = Annotated[str | None, typer.Option("--tls-key", help="TLS private key file")]
+NoTlsOption = Annotated[bool, typer.Option("--no-tls", help="Disable TLS")]
+SystemPromptFileOption = Annotated[str | None, typer.Option("--system-prompt-file", help="Path to system prompt file")]
+ModelOption = Annotated[str | None, typer.Option("--model", help="Model ID")]
+LogFileOption = Annotated[str | None, typer.Option("--log-file", help="Gateway log file path")]
+LogLevelOption = Annotated[str, typer.Option("--log-level", help="Log level")]
+ConversationLogOption = Annotated[str | None, typer.Option("--conversation-log", help="Log conversation to file")]
+
 app = typer.Typer(help="Zac agent CLI", invoke_without_command=True)
 
 
+def _load_config(config_file: Path) -> dict[str, Any]:
+    """Load a TOML config file, or an empty dict if it doesn't exist.
+
+    The parsed result is reused for as long as the file is unchanged.
+    """
+    try:
+        st = os.stat(config_file)
+    except FileNotFoundError:
+        return {}
+    return _parse_config(str(config_file), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(config_file: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    # mtime_ns only keys the cache. The stat'd size lets one read fetch the
+    # whole file; keep reading in case it grew since.
+    fd = os.open(config_file, os.O_RDONLY)
+    try:
+        data = os.read(fd, size + 1)
+        while chunk := os.read(fd, 65536):
+            data += chunk
+    finally:
+        os.close(fd)
+    return tomllib.loads(data.decode("utf-8"))
+
+
 def _get_api_key(paths: DefaultPaths) -> str:
     """Get the OpenRouter API key, prompting user if necessary."""
     # Try to get from environment or config
@@ -29,21 +73,13 @@ def _get_api_key(paths: DefaultPaths) -> str:
         return api_key
     
     # Try project config
-    project_config_path = paths.config_file
-    if project_config_path.is_file():
-        try:
-            import tomllib
-        except ImportError:
-            import tomli as tomllib
-        
-        try:
-            with open(project_config_path, "rb") as f:
-                project_config = tomllib.load(f)
-                if "open-router-api-key" in project_config:
-                    return project_config["open-router-api-key"]
-        except Exception:
-            pass
-    
+    try:
+        project_config = _load_config(paths.config_file)
+    except Exception:
+        project_config = {}
+    if "open-router-api-key" in project_config:
+        return project_config["open-router-api-key"]
+
     # Try user config
     user_config = load_user_config()
     if "open-router-api-key" in user_config:
@@ -94,16 +130,16 @@ def _run_user_prompt(prompt: str, model: str | None, api_key: str) -> None:
 @app.callback()
 def main_callback(
     ctx: typer.Context,
-    host: Annotated[str, typer.Option("--host", help="Bind address")] = DEFAULT_HOST,
-    port: Annotated[int, typer.Option("--port", help="Port")] = DEFAULT_PORT,
-    tls_cert: Annotated[str | None, typer.Option("--tls-cert", help="TLS certificate file")] = None,
-    tls_key: Annotated[str | None, typer.Option("--tls-key", help="TLS private key file")] = None,
-    no_tls: Annotated[bool, typer.Option("--no-tls", help="Disable TLS")] = False,
-    system_prompt_file: Annotated[str | None, typer.Option("--system-prompt-file", help="Path to system prompt file")] = None,
-    model: Annotated[str | None, typer.Option("--model", help="Model ID")] = None,
-    log_file: Annotated[str | None, typer.Option("--log-file", help="Gateway log file path")] = None,
-    log_level: Annotated[str, typer.Option("--log-level", help="Log level")] = DEFAULT_LOG_LEVEL,
-    conversation_log: Annotated[str | None, typer.Option("--conversation-log", help="Log conversation to file")] = None,
+    host: HostOption = DEFAULT_HOST,
+    port: PortOption = DEFAULT_PORT,
+    tls_cert: TlsCertOption = None,
+    tls_key: TlsKeyOption = None,
+    no_tls: NoTlsOption = False,
+    system_prompt_file: SystemPromptFileOption = None,
+    model: ModelOption = None,
+    log_file: LogFileOption = None,
+    log_level: LogLevelOption = DEFAULT_LOG_LEVEL,
+    conversation_log: ConversationLogOption = None,
     restart_gateway: Annotated[bool, typer.Option("--restart-gateway", help="Restart gateway before connecting")] = False,
     gateway: Annotated[str | None, typer.Option("--gateway", help="Connect to remote gateway URL")] = None,
     user_prompt: Annotated[str | None, typer.Option("--user-prompt", help="Send prompt and print response (no TUI)")] = None,
@@ -112,6 +148,13 @@ def main_callback(
     if ctx.invoked_subcommand is not None:
         return
 
+    from . import daemon, tui
+
+    # A remote gateway holds its own API key
+    if gateway and not user_prompt:
+        tui.launch(gateway_url=gateway)
+        return
+
     paths = DefaultPaths()
     api_key = _get_api_key(paths)
 
@@ -119,10 +162,6 @@ def main_callback(
         _run_user_prompt(user_prompt, model, api_key)
         return
 
-    if gateway:
-        tui.launch(gateway_url=gateway)
-        return
-
     random_port = random.randint(49152, 65535)
     use_tls = not no_tls
 
@@ -178,18 +217,20 @@ app.add_typer(gateway_app, name="gateway")
 
 @gateway_app.command("start")
 def gateway_start(
-    host: Annotated[str, typer.Option("--host", help="Bind address")] = DEFAULT_HOST,
-    port: Annotated[int, typer.Option("--port", help="Port")] = DEFAULT_PORT,
-    tls_cert: Annotated[str | None, typer.Option("--tls-cert", help="TLS certificate file")] = None,
-    tls_key: Annotated[str | None, typer.Option("--tls-key", help="TLS private key file")] = None,
-    no_tls: Annotated[bool, typer.Option("--no-tls", help="Disable TLS")] = False,
-    system_prompt_file: Annotated[str | None, typer.Option("--system-prompt-file", help="Path to system prompt file")] = None,
-    model: Annotated[str | None, typer.Option("--model", help="Model ID")] = None,
-    log_file: Annotated[str | None, typer.Option("--log-file", help="Gateway log file path")] = None,
-    log_level: Annotated[str, typer.Option("--log-level", help="Log level")] = DEFAULT_LOG_LEVEL,
-    conversation_log: Annotated[str | None, typer.Option("--conversation-log", help="Log conversation to file")] = None,
+    host: HostOption = DEFAULT_HOST,
+    port: PortOption = DEFAULT_PORT,
+    tls_cert: TlsCertOption = None,
+    tls_key: TlsKeyOption = None,
+    no_tls: NoTlsOption = False,
+    system_prompt_file: SystemPromptFileOption = None,
+    model: ModelOption = None,
+    log_file: LogFileOption = None,
+    log_level: LogLevelOption = DEFAULT_LOG_LEVEL,
+    conversation_log: ConversationLogOption = None,
 ) -> None:
     """Start the gateway daemon."""
+    from . import daemon
+
     paths = DefaultPaths()
     api_key = _get_api_key(paths)
     daemon.start(
@@ -210,12 +251,16 @@ def gateway_start(
 @gateway_app.command("stop")
 def gateway_stop() -> None:
     """Stop the gateway daemon."""
+    from . import daemon
+
     daemon.stop()
 
 
 @gateway_app.command("status")
 def gateway_status() -> None:
     """Check gateway status."""
+    from . import daemon
+
     paths = DefaultPaths()
     pid = daemon.status(paths)
     if pid:
@@ -227,18 +272,20 @@ def gateway_status() -> None:
 
 @gateway_app.command("restart")
 def gateway_restart(
-    host: Annotated[str, typer.Option("--host", help="Bind address")] = DEFAULT_HOST,
-    port: Annotated[int, typer.Option("--port", help="Port")] = DEFAULT_PORT,
-    tls_cert: Annotated[str | None, typer.Option("--tls-cert", help="TLS certificate file")] = None,
-    tls_key: Annotated[str | None, typer.Option("--tls-key", help="TLS private key file")] = None,
-    no_tls: Annotated[bool, typer.Option("--no-tls", help="Disable TLS")] = False,
-    system_prompt_file: Annotated[str | None, typer.Option("--system-prompt-file", help="Path to system prompt file")] = None,
-    model: Annotated[str | None, typer.Option("--model", help="Model ID")] = None,
-    log_file: Annotated[str | None, typer.Option("--log-file", help="Gateway log file path")] = None,
-    log_level: Annotated[str, typer.Option("--log-level", help="Log level")] = DEFAULT_LOG_LEVEL,
-    conversation_log: Annotated[str | None, typer.Option("--conversation-log", help="Log conversation to file")] = None,
+    host: HostOption = DEFAULT_HOST,
+    port: PortOption = DEFAULT_PORT,
+    tls_cert: TlsCertOption = None,
+    tls_key: TlsKeyOption = None,
+    no_tls: NoTlsOption = False,
+    system_prompt_file: SystemPromptFileOption = None,
+    model: ModelOption = None,
+    log_file: LogFileOption = None,
+    log_level: LogLevelOption = DEFAULT_LOG_LEVEL,
+    conversation_log: ConversationLogOption = None,
 ) -> None:
     """Restart the gateway daemon."""
+    from . import daemon
+
     paths = DefaultPaths()
     api_key = _get_api_key(paths)
     daemon.restart(
@@ -257,7 +304,6 @@ def gateway_restart(
 
 
 # Add fix command directly to main app
-from .fix import _run_fix_mode as run_fix
 from .fix import DEFAULT_DB_PATH
 
 
@@ -272,12 +318,25 @@ def fix(
 ) -> None:
     """Fix GitHub issues automatically."""
     import asyncio
+
+    from .fix import _run_fix_mode as run_fix
+
     asyncio.run(run_fix(max_cost, max_issues, model, reasoning_effort, db, issue))
 
 
 def main(argv: list[str] | None = None) -> None:
     """Main entry point."""
-    app()
+    if argv is None:
+        argv = sys.argv[1:]
+    # Status checks are often scripted; answer them without building the
+    # full command tree
+    if argv == ["gateway", "status"]:
+        try:
+            gateway_status()
+        except typer.Exit as e:
+            sys.exit(e.exit_code)
+        return
+    app(args=argv)
 
 
 if __name__ == "__main__":
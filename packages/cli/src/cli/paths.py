@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 
@@ -14,17 +15,20 @@ def find_repo_root() -> Path:
     override = os.environ.get("ZAC_ROOT")
     if override:
         return Path(override).resolve()
+    return _find_repo_root_above_package()
 
+
+@functools.cache
+def _find_repo_root_above_package() -> Path:
+    # Depends only on where this file lives, so the walk is done once
     current = Path(__file__).resolve().parent
     while current != current.parent:
-        pyproject = current / "pyproject.toml"
-        if pyproject.is_file():
-            try:
-                text = pyproject.read_text()
-                if 'name = "zac-mono"' in text:
-                    return current
-            except OSError:
-                pass
+        try:
+            text = (current / "pyproject.toml").read_text()
+            if 'name = "zac-mono"' in text:
+                return current
+        except OSError:
+            pass
         current = current.parent
 
     raise RuntimeError(
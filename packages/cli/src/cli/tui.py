@@ -2,27 +2,45 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import shutil
 import subprocess
+from pathlib import Path
 
 from .paths import DefaultPaths
 
 
+# Written into node_modules after a successful install, so it disappears
+# along with node_modules
+_INSTALL_STAMP = ".zac-install-stamp"
+
+
+def _lockfile_stamp(tui_dir: Path) -> str:
+    try:
+        return hashlib.sha256((tui_dir / "package-lock.json").read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return ""
+
+
 def _ensure_node_modules(paths: DefaultPaths) -> None:
-    """Run npm install if node_modules is missing."""
+    """Run npm install if node_modules is missing or was installed from another lockfile."""
     tui_dir = paths.tui_entry.parent.parent
-    if not (tui_dir / "node_modules").is_dir():
-        print("Installing TUI dependencies...")
-        result = subprocess.run(
-            ["npm", "install"],
-            cwd=str(tui_dir),
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"npm install failed: {result.stderr}")
-        print("TUI dependencies installed.")
+    stamp_file = tui_dir / "node_modules" / _INSTALL_STAMP
+    try:
+        if stamp_file.read_text() == _lockfile_stamp(tui_dir):
+            return
+    except OSError:
+        pass
+
+    print("Installing TUI dependencies...")
+    # npm's output goes straight to the terminal rather than being buffered
+    result = subprocess.run(["npm", "install"], cwd=str(tui_dir))
+    if result.returncode != 0:
+        raise RuntimeError(f"npm install failed with exit code {result.returncode}")
+    # npm install may itself rewrite the lockfile
+    stamp_file.write_text(_lockfile_stamp(tui_dir))
+    print("TUI dependencies installed.")
 
 
 def launch(
@@ -48,8 +66,9 @@ def launch(
         # TUI connects to localhost regardless of what host the gateway binds
         gateway_url = f"{scheme}://localhost:{port}"
 
-    env = os.environ.copy()
-    env["ZAC_GATEWAY_URL"] = gateway_url
+    # The exec'd process inherits our environment, so there is no need to
+    # build a copy of it
+    os.environ["ZAC_GATEWAY_URL"] = gateway_url
 
     entry = str(paths.tui_entry)
 
@@ -57,4 +76,4 @@ def launch(
     if npx is None:
         raise RuntimeError("npx not found in PATH. Install Node.js to use the TUI.")
 
-    os.execvpe(npx, ["npx", "tsx", entry], env)
+    os.execvp(npx, ["npx", "tsx", entry])
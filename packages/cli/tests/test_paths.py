@@ -10,6 +10,10 @@ def test_find_repo_root_finds_zac_mono():
     assert 'name = "zac-mono"' in (root / "pyproject.toml").read_text()
 
 
+def test_find_repo_root_walks_once():
+    assert find_repo_root() is find_repo_root()
+
+
 def test_find_repo_root_env_override(tmp_path, monkeypatch):
     monkeypatch.setenv("ZAC_ROOT", str(tmp_path))
     assert find_repo_root() == tmp_path
@@ -1,39 +1,60 @@
+import os
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
 from cli.paths import DefaultPaths
-from cli.tui import launch
+from cli.tui import _ensure_node_modules, launch
 
 
 def test_launch_sets_gateway_url_and_execs(tmp_path):
     paths = DefaultPaths(tmp_path)
-    with patch("cli.tui.shutil.which", return_value="/usr/bin/npx"), \
-         patch("cli.tui.os.execvpe") as mock_exec:
+    with patch("cli.tui._ensure_node_modules"), \
+         patch("cli.tui.shutil.which", return_value="/usr/bin/npx"), \
+         patch.dict(os.environ), \
+         patch("cli.tui.os.execvp") as mock_exec:
         launch(host="0.0.0.0", port=9000, use_tls=True, paths=paths)
 
         mock_exec.assert_called_once()
         args = mock_exec.call_args
         assert args[0][0] == "/usr/bin/npx"
         assert args[0][1] == ["npx", "tsx", str(paths.tui_entry)]
-        env = args[0][2]
-        assert env["ZAC_GATEWAY_URL"] == "wss://localhost:9000"
+        assert os.environ["ZAC_GATEWAY_URL"] == "wss://localhost:9000"
 
 
 def test_launch_no_tls_uses_ws_scheme(tmp_path):
     paths = DefaultPaths(tmp_path)
-    with patch("cli.tui.shutil.which", return_value="/usr/bin/npx"), \
-         patch("cli.tui.os.execvpe") as mock_exec:
+    with patch("cli.tui._ensure_node_modules"), \
+         patch("cli.tui.shutil.which", return_value="/usr/bin/npx"), \
+         patch.dict(os.environ), \
+         patch("cli.tui.os.execvp"):
         launch(host="0.0.0.0", port=8765, use_tls=False, paths=paths)
 
-        env = mock_exec.call_args[0][2]
-        assert env["ZAC_GATEWAY_URL"] == "ws://localhost:8765"
+        assert os.environ["ZAC_GATEWAY_URL"] == "ws://localhost:8765"
 
 
 def test_launch_raises_if_npx_not_found(tmp_path):
     paths = DefaultPaths(tmp_path)
-    with patch("cli.tui.shutil.which", return_value=None):
+    with patch("cli.tui._ensure_node_modules"), \
+         patch("cli.tui.shutil.which", return_value=None), \
+         patch.dict(os.environ):
         try:
             launch(paths=paths)
             assert False, "Should have raised RuntimeError"
         except RuntimeError as e:
             assert "npx not found" in str(e)
+
+
+def test_ensure_node_modules_installs_once_per_lockfile(tmp_path):
+    paths = DefaultPaths(tmp_path)
+    tui_dir = tmp_path / "packages" / "tui"
+    (tui_dir / "node_modules").mkdir(parents=True)
+    (tui_dir / "package-lock.json").write_text('{"lockfileVersion": 3}')
+
+    with patch("cli.tui.subprocess.run", return_value=MagicMock(returncode=0)) as mock_run:
+        _ensure_node_modules(paths)
+        _ensure_node_modules(paths)
+        assert mock_run.call_count == 1
+
+        (tui_dir / "package-lock.json").write_text('{"lockfileVersion": 3, "x": 1}')
+        _ensure_node_modules(paths)
+        assert mock_run.call_count == 2
@@ -138,4 +138,5 @@ async def run(
 
     logger.info("Shutting down...")
     await agent.stop()
+    await session.close()
     logger.info("Agent stopped")
@@ -6,6 +6,7 @@ import logging
 from typing import Any
 
 import httpx
+import orjson
 from websockets.asyncio.server import ServerConnection
 
 from agent import AgentClient
@@ -27,6 +28,18 @@ class Session:
         self.clients: set[ServerConnection] = set()
         self._prompt_lock = asyncio.Lock()
         self._model_cache: list[dict[str, Any]] | None = None
+        self._http: httpx.AsyncClient | None = None
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, so repeat lookups reuse the pooled connection."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=10)
+        return self._http
+
+    async def close(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     def add_client(self, ws: ServerConnection) -> None:
         self.clients.add(ws)
@@ -116,16 +129,15 @@ class Session:
         if self._model_cache is not None:
             return self._model_cache
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get("https://openrouter.ai/api/v1/models", timeout=10)
-                resp.raise_for_status()
-                data = resp.json()
-                self._model_cache = [
-                    {"id": m["id"], "name": m.get("name", m["id"]), "description": m.get("description", "")}
-                    for m in data.get("data", [])
-                ]
-                logger.info("Fetched %d models from OpenRouter", len(self._model_cache))
-                return self._model_cache
+            resp = await self._http_client().get("https://openrouter.ai/api/v1/models")
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+            self._model_cache = [
+                {"id": m["id"], "name": m.get("name", m["id"]), "description": m.get("description", "")}
+                for m in data.get("data", [])
+            ]
+            logger.info("Fetched %d models from OpenRouter", len(self._model_cache))
+            return self._model_cache
         except Exception as e:
             logger.warning("Failed to fetch model list: %s", e)
             return []
@@ -133,52 +145,51 @@ class Session:
     async def _handle_model_info(self, model_id: str) -> None:
         """Fetch and display info about a specific model from OpenRouter."""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.get("https://openrouter.ai/api/v1/models", timeout=10)
-                resp.raise_for_status()
-                data = resp.json()
-                
-                model_data = next((m for m in data.get("data", []) if m["id"] == model_id), None)
-                if not model_data:
-                    await self.broadcast(json.dumps({"type": "error", "message": f"Model not found: {model_id}"}))
-                    return
-                
-                pricing = model_data.get("pricing", {})
-                top_provider = model_data.get("top_provider", {})
-                architecture = model_data.get("architecture", {})
-                recommended = model_data.get("recommended", {})
-                
-                await self.broadcast(json.dumps({
-                    "type": "model_info",
-                    "model_id": model_data.get("id", model_id),
-                    "name": model_data.get("name", model_id),
-                    "description": model_data.get("description", ""),
-                    "pricing": {
-                        "prompt": pricing.get("prompt", "0"),
-                        "completion": pricing.get("completion", "0"),
-                    } if pricing else None,
-                    "context_length": model_data.get("context_length", 0),
-                    "top_provider": {
-                        "provider": top_provider.get("provider_name", ""),
-                        "max_completion_tokens": top_provider.get("max_completion_tokens", 0),
-                        "supports_vision": top_provider.get("supports_vision", False),
-                    } if top_provider else None,
-                    "architecture": {
-                        "model": architecture.get("model", ""),
-                        "mode": architecture.get("mode", ""),
-                        "tokenizer": architecture.get("tokenizer", ""),
-                        "instruct_type": architecture.get("instruct_type", ""),
-                    } if architecture else None,
-                    "recommended": {
-                        "prompt": recommended.get("prompt", 0),
-                        "completion": recommended.get("completion", 0),
-                    } if recommended else None,
-                    "enabled": model_data.get("enabled", True),
-                    "modality": model_data.get("modality", ""),
-                    "created": model_data.get("created", 0),
-                    "route": model_data.get("route", ""),
-                }))
-                logger.info("Fetched model info for %s", model_id)
+            resp = await self._http_client().get("https://openrouter.ai/api/v1/models")
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+
+            model_data = next((m for m in data.get("data", []) if m["id"] == model_id), None)
+            if not model_data:
+                await self.broadcast(json.dumps({"type": "error", "message": f"Model not found: {model_id}"}))
+                return
+
+            pricing = model_data.get("pricing", {})
+            top_provider = model_data.get("top_provider", {})
+            architecture = model_data.get("architecture", {})
+            recommended = model_data.get("recommended", {})
+
+            await self.broadcast(json.dumps({
+                "type": "model_info",
+                "model_id": model_data.get("id", model_id),
+                "name": model_data.get("name", model_id),
+                "description": model_data.get("description", ""),
+                "pricing": {
+                    "prompt": pricing.get("prompt", "0"),
+                    "completion": pricing.get("completion", "0"),
+                } if pricing else None,
+                "context_length": model_data.get("context_length", 0),
+                "top_provider": {
+                    "provider": top_provider.get("provider_name", ""),
+                    "max_completion_tokens": top_provider.get("max_completion_tokens", 0),
+                    "supports_vision": top_provider.get("supports_vision", False),
+                } if top_provider else None,
+                "architecture": {
+                    "model": architecture.get("model", ""),
+                    "mode": architecture.get("mode", ""),
+                    "tokenizer": architecture.get("tokenizer", ""),
+                    "instruct_type": architecture.get("instruct_type", ""),
+                } if architecture else None,
+                "recommended": {
+                    "prompt": recommended.get("prompt", 0),
+                    "completion": recommended.get("completion", 0),
+                } if recommended else None,
+                "enabled": model_data.get("enabled", True),
+                "modality": model_data.get("modality", ""),
+                "created": model_data.get("created", 0),
+                "route": model_data.get("route", ""),
+            }))
+            logger.info("Fetched model info for %s", model_id)
         except Exception as e:
             logger.warning("Failed to fetch model info: %s", e)
             await self.broadcast(json.dumps({"type": "error", "message": f"Failed to fetch model info: {e}"}))